@@ -1,25 +1,160 @@
 """FastAPI application entry point."""
 
 import os
+import asyncio
+import gzip
+import hashlib
+import mimetypes
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from pathlib import Path
+from typing import Optional
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.exception_handlers import http_exception_handler
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, Response
+from starlette.exceptions import HTTPException as StarletteHTTPException
 from dotenv import load_dotenv
 
 from src.db import init_db
 from src.api import router, websocket_endpoint
+from src.middleware import ProcessTimeMiddleware
 
-load_dotenv()
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+# Deployments that inject the environment directly can set SKIP_DOTENV=1
+if os.getenv("SKIP_DOTENV") != "1":
+    load_dotenv()
+
+FRONTEND_DIST = Path(__file__).resolve().parent / "frontend" / "dist"
+INDEX_HTML = FRONTEND_DIST / "index.html"
+ASSETS_DIR = FRONTEND_DIST / "assets"
+
+
+def scan_frontend_files(dist_dir: Path) -> frozenset:
+    """Collect relative paths of every file in the built frontend."""
+    if not dist_dir.is_dir():
+        return frozenset()
+    return frozenset(p.relative_to(dist_dir).as_posix() for p in dist_dir.rglob("*") if p.is_file())
+
+
+def load_index_html(index_path: Path) -> tuple[bytes, str]:
+    """Read index.html into memory and compute its ETag."""
+    if not index_path.is_file():
+        return b"", ""
+    content = index_path.read_bytes()
+    return content, f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+
+
+# Paths that must keep real 404s instead of falling back to index.html
+NON_SPA_PREFIXES = ("/api/", "/ws/", "/assets/")
+
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "image/svg+xml")
+
+
+def load_assets(assets_dir: Path) -> dict[str, dict]:
+    """
+    Load hashed Vite assets into memory keyed by path relative to assets/.
+
+    Text-like assets are also pre-compressed once so requests only pick an encoding.
+    """
+    if not assets_dir.is_dir():
+        return {}
+    assets = {}
+    for p in assets_dir.rglob("*"):
+        if not p.is_file():
+            continue
+        content = p.read_bytes()
+        media_type = mimetypes.guess_type(p.name)[0] or "application/octet-stream"
+        entry = {"media_type": media_type, "identity": content}
+        if media_type.startswith(COMPRESSIBLE_TYPES):
+            entry["gzip"] = gzip.compress(content, 9)
+            if brotli is not None:
+                entry["br"] = brotli.compress(content, quality=11)
+        assets[p.relative_to(assets_dir).as_posix()] = entry
+    return assets
+
+
+def parse_accept_encoding(accept_encoding: str) -> dict[str, float]:
+    """Map each coding in an Accept-Encoding header to its q-value (default 1)."""
+    qualities = {}
+    for token in accept_encoding.split(","):
+        name, *params = token.split(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value.strip())
+                except ValueError:
+                    quality = 0.0
+        qualities[name] = quality
+    return qualities
+
+
+def choose_encoding(accept_encoding: str, available: dict) -> Optional[str]:
+    """
+    Pick the pre-compressed encoding the client rates highest (ties: br > gzip > identity).
+
+    A coding listed with q=0 is refused even if "*" is accepted. Identity is
+    acceptable unless refused explicitly or through "*;q=0". Returns None when
+    no available encoding is acceptable.
+    """
+    qualities = parse_accept_encoding(accept_encoding)
+    wildcard = qualities.get("*")
+    best, best_quality = None, 0.0
+    for encoding in ("br", "gzip", "identity"):
+        if encoding not in available:
+            continue
+        if encoding in qualities:
+            quality = qualities[encoding]
+        elif wildcard is not None:
+            quality = wildcard
+        elif encoding == "identity":
+            # Implicitly acceptable, but ranked below any coding the client listed
+            quality = 0.001
+        else:
+            quality = 0.0
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def index_html_response(request: Request) -> Response:
+    """Serve the preloaded index.html, honouring If-None-Match."""
+    etag = request.app.state.index_etag
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=request.app.state.index_html_bytes,
+        media_type="text/html",
+        headers=headers,
+    )
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
+    # Size the default executor used by asyncio.to_thread for blocking LLM calls
+    executor = ThreadPoolExecutor(max_workers=int(os.getenv("THREAD_POOL_SIZE", "32")))
+    asyncio.get_running_loop().set_default_executor(executor)
+
     # Startup: Initialize database
     await init_db()
 
+    # Build the static file map once so SPA requests skip per-request stat calls
+    app.state.static_files = scan_frontend_files(FRONTEND_DIST)
+    app.state.index_html_bytes, app.state.index_etag = load_index_html(INDEX_HTML)
+    app.state.assets = load_assets(ASSETS_DIR)
+
     # Check if we should seed data
     if os.getenv("SEED_DATABASE", "false").lower() == "true":
         from src.db.seed import seed_database
@@ -31,7 +166,7 @@ async def lifespan(app: FastAPI):
     yield
 
     # Shutdown: cleanup if needed
-    pass
+    executor.shutdown(wait=False)
 
 
 app = FastAPI(
@@ -45,11 +180,22 @@ app = FastAPI(
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:5173", "http://localhost:3000", "http://127.0.0.1:5173"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # The frontend sends no cookies and only uses GET/POST with a JSON body, so keep
+    # the policy narrow and let browsers cache preflight responses for a day
+    allow_credentials=False,
+    allow_methods=["GET", "POST", "OPTIONS"],
+    allow_headers=["Content-Type", "Authorization"],
+    max_age=86400,
 )
 
+# Compress JSON API responses; added after CORS so it wraps the CORS layer.
+# Pre-compressed assets already carry Content-Encoding and pass through untouched.
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=6)
+
+# Request timing header for profiling (optional); written as pure ASGI (see src/middleware/asgi.py)
+if os.getenv("PROCESS_TIME_HEADER", "false").lower() == "true":
+    app.add_middleware(ProcessTimeMiddleware)
+
 # API routes
 app.include_router(router, prefix="/api")
 
@@ -58,44 +204,83 @@ app.websocket("/ws/chat")(websocket_endpoint)
 
 
 # Health check
+HEALTH_BODY = b'{"status":"healthy","service":"whatsapp-order-intake"}'
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy", "service": "whatsapp-order-intake"}
+    # Pre-encoded body skips FastAPI's serialization for frequent liveness probes.
+    # A fresh Response is built per call since middleware may mutate its headers.
+    return Response(content=HEALTH_BODY, media_type="application/json")
 
 
-# Serve frontend static files if they exist
-frontend_dist = os.path.join(os.path.dirname(__file__), "frontend", "dist")
-if os.path.exists(frontend_dist):
-    app.mount("/assets", StaticFiles(directory=os.path.join(frontend_dist, "assets")), name="assets")
+def mount_frontend(app: FastAPI, dist_dir: Path) -> None:
+    """Register the built frontend's asset, index and SPA fallback routes."""
+    @app.get("/assets/{path:path}")
+    async def serve_asset(path: str, request: Request):
+        """Serve content-hashed build assets from memory."""
+        asset = request.app.state.assets.get(path)
+        if asset is None:
+            raise HTTPException(status_code=404, detail="Asset not found")
+        encoding = choose_encoding(request.headers.get("accept-encoding", ""), asset)
+        if encoding is None:
+            raise HTTPException(status_code=406, detail="No acceptable content encoding")
+        headers = {
+            "Cache-Control": "public, max-age=31536000, immutable",
+            "Vary": "Accept-Encoding",
+        }
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        return Response(content=asset[encoding], media_type=asset["media_type"], headers=headers)
 
     @app.get("/")
-    async def serve_frontend():
+    async def serve_frontend(request: Request):
         """Serve the frontend application."""
-        return FileResponse(os.path.join(frontend_dist, "index.html"))
+        return index_html_response(request)
 
-    @app.get("/{path:path}")
-    async def serve_frontend_routes(path: str):
-        """Serve frontend for all other routes (SPA routing)."""
-        # Check if it's an API route
-        if path.startswith("api/") or path.startswith("ws/"):
-            return {"error": "Not found"}
+    @app.exception_handler(StarletteHTTPException)
+    async def spa_fallback_handler(request: Request, exc: StarletteHTTPException):
+        """Serve frontend files and index.html for unmatched routes (SPA routing)."""
+        path = request.url.path
+        if (
+            exc.status_code != 404
+            or request.method not in ("GET", "HEAD")
+            or path.startswith(NON_SPA_PREFIXES)
+        ):
+            return await http_exception_handler(request, exc)
 
-        # Check if file exists in dist
-        file_path = os.path.join(frontend_dist, path)
-        if os.path.exists(file_path) and os.path.isfile(file_path):
-            return FileResponse(file_path)
+        # Check if file exists in dist (map built at startup)
+        relative_path = path.lstrip("/")
+        if relative_path in request.app.state.static_files:
+            return FileResponse(dist_dir / relative_path)
 
         # Return index.html for SPA routing
-        return FileResponse(os.path.join(frontend_dist, "index.html"))
+        return index_html_response(request)
+
+
+# Serve frontend static files if they exist
+if FRONTEND_DIST.exists():
+    mount_frontend(app, FRONTEND_DIST)
 
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
 
+    # WEB_CONCURRENCY sets the worker count for production (2 * CPU cores + 1 is a
+    # reasonable starting point). Uvicorn refuses reload with multiple workers, so
+    # auto-reload is only enabled for the single-worker dev setup. Note that
+    # WebSocket connections are tracked per worker process.
+    workers = max(1, int(os.getenv("WEB_CONCURRENCY", "1")))
+
     uvicorn.run(
         "app:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=workers == 1,
+        workers=workers,
+        # uvloop is not available on Windows; fall back to the stdlib loop there
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
     )
@@ -10,13 +10,15 @@ Usage:
 """
 
 import argparse
-import json
+import os
+import sys
+import orjson
 from dotenv import load_dotenv
-from src.processor import OrderProcessor
-from src.odoo_client import MockOdooClient
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from .env file (containers that inject the
+# environment directly can set SKIP_DOTENV=1 to skip the file lookup)
+if os.getenv("SKIP_DOTENV") != "1":
+    load_dotenv()
 
 
 # Sample messages from the assessment
@@ -46,9 +48,19 @@ Need by Thursday latest""",
     },
 }
 
+# Interactive menu choice -> sample key
+SAMPLE_MENU = {
+    "1": "clear_order",
+    "2": "ambiguous_items",
+    "3": "multiple_items",
+    "4": "voice_transcription",
+}
+
+
+DIVIDER = "=" * 60
+SUB_DIVIDER = "-" * 60
 
-def print_divider(char="=", length=60):
-    print(char * length)
+CONFIDENCE_ICONS = {"high": "🟢", "medium": "🟡", "low": "🔴"}
 
 
 def print_result(result, show_json=True):
@@ -60,62 +72,65 @@ def print_result(result, show_json=True):
     order = result.extracted_order
     erp = result.erp_payload
 
-    print("\n📋 EXTRACTED ORDER")
-    print_divider("-")
-    print(f"Customer: {order.customer_name}")
+    # Collect all lines and write them once instead of one print() per line
+    lines = []
+    out = lines.append
+
+    out("\n📋 EXTRACTED ORDER")
+    out(SUB_DIVIDER)
+    out(f"Customer: {order.customer_name}")
     if order.customer_organization:
-        print(f"Organization: {order.customer_organization}")
-    print(f"Delivery: {order.requested_delivery_date or 'Not specified'}", end="")
+        out(f"Organization: {order.customer_organization}")
+    delivery = f"Delivery: {order.requested_delivery_date or 'Not specified'}"
     if order.delivery_urgency:
-        print(f" ({order.delivery_urgency})")
-    else:
-        print()
-    print(f"Overall Confidence: {order.overall_confidence.value.upper()}")
-    print(f"Requires Clarification: {'Yes' if order.requires_clarification else 'No'}")
+        delivery += f" ({order.delivery_urgency})"
+    out(delivery)
+    out(f"Overall Confidence: {order.overall_confidence.value.upper()}")
+    out(f"Requires Clarification: {'Yes' if order.requires_clarification else 'No'}")
 
-    print("\n📦 ITEMS")
-    print_divider("-")
+    out("\n📦 ITEMS")
+    out(SUB_DIVIDER)
     for item in order.items:
-        conf_icon = {"high": "🟢", "medium": "🟡", "low": "🔴"}[item.confidence.value]
-        print(f"  {conf_icon} {item.product_name}: {item.quantity} {item.unit}")
+        out(f"  {CONFIDENCE_ICONS[item.confidence.value]} {item.product_name}: {item.quantity} {item.unit}")
         if item.notes:
-            print(f"     ⚠️  {item.notes}")
+            out(f"     ⚠️  {item.notes}")
 
     if order.clarification_needed:
-        print("\n⚠️  CLARIFICATION NEEDED")
-        print_divider("-")
+        out("\n⚠️  CLARIFICATION NEEDED")
+        out(SUB_DIVIDER)
         for item in order.clarification_needed:
-            print(f"  • {item}")
+            out(f"  • {item}")
 
     if show_json:
-        print("\n📤 ERP PAYLOAD (JSON)")
-        print_divider("-")
-        print(json.dumps(erp.model_dump(), indent=2))
+        out("\n📤 ERP PAYLOAD (JSON)")
+        out(SUB_DIVIDER)
+        out(erp.model_dump_json(indent=2))
 
     # Show Odoo result if present
     if result.odoo_result:
-        print("\n🏢 ODOO SUBMISSION")
-        print_divider("-")
+        out("\n🏢 ODOO SUBMISSION")
+        out(SUB_DIVIDER)
         if result.odoo_result.success:
-            print(f"  ✅ Order created: {result.odoo_result.order_name} (ID: {result.odoo_result.order_id})")
+            out(f"  ✅ Order created: {result.odoo_result.order_name} (ID: {result.odoo_result.order_id})")
         else:
-            print(f"  ❌ Failed: {result.odoo_result.error}")
+            out(f"  ❌ Failed: {result.odoo_result.error}")
         if result.odoo_result.unmatched_products:
-            print(f"  ⚠️  Unmatched products: {', '.join(result.odoo_result.unmatched_products)}")
+            out(f"  ⚠️  Unmatched products: {', '.join(result.odoo_result.unmatched_products)}")
 
-    print("\n💬 CONFIRMATION MESSAGE")
-    print_divider("-")
-    print(result.confirmation_message)
+    out("\n💬 CONFIRMATION MESSAGE")
+    out(SUB_DIVIDER)
+    out(result.confirmation_message)
 
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
 
-def run_interactive():
+
+def run_interactive(processor):
     """Run interactive demo mode."""
-    print("\n" + "=" * 60)
+    print("\n" + DIVIDER)
     print("  WhatsApp Order Intake Automation - Demo")
     print("  Kijani Supplies B2B Order Processing")
-    print("=" * 60)
-
-    processor = OrderProcessor()
+    print(DIVIDER)
 
     while True:
         print("\nSelect an option:")
@@ -132,20 +147,15 @@ def run_interactive():
         if choice == "q":
             print("\nGoodbye!")
             break
-        elif choice == "1":
-            process_sample(processor, "clear_order")
-        elif choice == "2":
-            process_sample(processor, "ambiguous_items")
-        elif choice == "3":
-            process_sample(processor, "multiple_items")
-        elif choice == "4":
-            process_sample(processor, "voice_transcription")
+        elif choice in SAMPLE_MENU:
+            process_sample(processor, SAMPLE_MENU[choice])
         elif choice == "5":
             print("\nEnter your WhatsApp message (press Enter twice to submit):")
             lines = []
             while True:
-                line = input()
-                if line == "":
+                # readline avoids input()'s readline-module setup; "" means EOF
+                line = sys.stdin.readline().rstrip("\r\n")
+                if not line:
                     break
                 lines.append(line)
             if lines:
@@ -162,9 +172,9 @@ def run_interactive():
 def process_sample(processor, sample_key, submit_to_odoo=False):
     """Process a specific sample message."""
     sample = SAMPLE_MESSAGES[sample_key]
-    print(f"\n{'=' * 60}")
+    print(f"\n{DIVIDER}")
     print(f"  {sample['name']}")
-    print("=" * 60)
+    print(DIVIDER)
     print(f"\n📱 INPUT MESSAGE:\n{sample['message']}")
     print("\nProcessing...")
     result = processor.process(sample["message"], submit_to_odoo=submit_to_odoo)
@@ -175,7 +185,7 @@ def run_all_samples(processor, submit_to_odoo=False):
     """Run all sample messages."""
     for key in SAMPLE_MESSAGES:
         process_sample(processor, key, submit_to_odoo=submit_to_odoo)
-        print("\n" + "=" * 60 + "\n")
+        print(f"\n{DIVIDER}\n")
 
 
 def main():
@@ -197,9 +207,14 @@ def main():
 
     args = parser.parse_args()
 
+    # Import the processing stack only after argument parsing so --help stays fast
+    from src.processor import OrderProcessor
+
     # Initialize Odoo client if requested
     odoo_client = None
     if args.odoo:
+        from src.odoo_client import MockOdooClient
+
         odoo_client = MockOdooClient()
         odoo_client.connect()
         print("🏢 Odoo integration enabled (using mock client)")
@@ -209,22 +224,25 @@ def main():
     if args.message:
         result = processor.process(args.message, submit_to_odoo=args.odoo)
         if args.json:
+            # Dump the whole result tree in one pydantic-core pass, then pick fields
+            dumped = result.model_dump()
             output = {
-                "extracted_order": result.extracted_order.model_dump() if result.extracted_order else None,
-                "erp_payload": result.erp_payload.model_dump() if result.erp_payload else None,
-                "confirmation_message": result.confirmation_message,
-                "success": result.success,
-                "error": result.error,
+                "extracted_order": dumped["extracted_order"],
+                "erp_payload": dumped["erp_payload"],
+                "confirmation_message": dumped["confirmation_message"],
+                "success": dumped["success"],
+                "error": dumped["error"],
             }
             if result.odoo_result:
-                output["odoo_result"] = result.odoo_result.model_dump()
-            print(json.dumps(output, indent=2))
+                output["odoo_result"] = dumped["odoo_result"]
+            sys.stdout.flush()
+            sys.stdout.buffer.write(orjson.dumps(output, option=orjson.OPT_INDENT_2) + b"\n")
         else:
             print_result(result)
     elif args.test:
         run_all_samples(processor, submit_to_odoo=args.odoo)
     else:
-        run_interactive()
+        run_interactive(processor)
 
 
 if __name__ == "__main__":
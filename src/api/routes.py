@@ -1,12 +1,17 @@
 """FastAPI route definitions."""
 
+import asyncio
+import hashlib
 import time
+import orjson
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
-from sqlalchemy import select, func
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Header, Query, Response
+from pydantic import TypeAdapter
+from sqlalchemy import select, insert, func, case, bindparam, tuple_, DateTime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload, raiseload
 
 from ..db import (
     get_db,
@@ -21,14 +26,17 @@ from ..db import (
     CumulativeOrderItem,
 )
 from ..processor import OrderProcessor
-from ..models import ConfidenceLevel
+from ..models import ConfidenceLevel, ExtractedItem, ProcessingResult
+from ..erp_payload import confidence_to_score
 from ..services.history import (
     get_customer_order_history,
     get_customer_frequent_items,
     format_order_history_context,
+    extract_organization_hint,
 )
 from ..services.excel_parser import parse_excel_order, excel_order_to_text
 from ..services.order_state import OrderStateManager
+from ..services.product_matching import normalize_product_name
 from .schemas import (
     MessageCreate,
     ClarificationResponse,
@@ -109,6 +117,115 @@ SAMPLE_MESSAGES = [
     ),
 ]
 
+# Static gallery payload, serialized once at import
+SAMPLE_MESSAGES_JSON = orjson.dumps([m.model_dump() for m in SAMPLE_MESSAGES])
+SAMPLE_MESSAGES_ETAG = f'"{hashlib.sha256(SAMPLE_MESSAGES_JSON).hexdigest()[:16]}"'
+SAMPLE_MESSAGES_HEADERS = {
+    # Fixed for the life of the process; let the browser reuse it and revalidate by ETag
+    "Cache-Control": "public, max-age=3600",
+    "ETag": SAMPLE_MESSAGES_ETAG,
+}
+
+# Upper bound on list page sizes, so no request materializes an unbounded result
+MAX_PAGE_SIZE = 500
+
+# Largest accepted Excel upload
+MAX_EXCEL_UPLOAD_BYTES = 20 * 1024 * 1024
+
+# Dumps a whole list of extracted items in one pydantic-core call rather than
+# one model_dump per item
+EXTRACTED_ITEMS_ADAPTER = TypeAdapter(list[ExtractedItem])
+
+# Column selections for list endpoints. The rows are returned as-is and FastAPI
+# validates them against the response model by attribute in one pydantic-core
+# pass, with no ORM objects hydrated. Response DTOs built one at a time from DB
+# rows or already-validated extraction output use model_construct instead.
+ORDER_RESPONSE_COLUMNS = tuple(getattr(Order, name) for name in OrderResponse.model_fields)
+CUSTOMER_RESPONSE_COLUMNS = tuple(getattr(Customer, name) for name in CustomerResponse.model_fields)
+PRODUCT_RESPONSE_COLUMNS = tuple(getattr(Product, name) for name in ProductResponse.model_fields)
+
+# Statements with no per-request parameters are built once; SQLAlchemy's compiled
+# cache then serves their SQL without re-walking the construct on every request
+LIST_CUSTOMERS_QUERY = select(*CUSTOMER_RESPONSE_COLUMNS).order_by(Customer.name)
+LIST_PRODUCTS_QUERY = select(*PRODUCT_RESPONSE_COLUMNS).order_by(Product.category, Product.name)
+
+# All summary counters and averages in one round-trip using conditional aggregation.
+# The day and week boundaries are computed per request and bound as parameters.
+METRICS_SUMMARY_QUERY = select(
+    func.count(Order.id).label("total"),
+    func.count(case((Order.created_at >= bindparam("today_start", type_=DateTime), 1))).label("today"),
+    func.count(case((Order.created_at >= bindparam("week_start", type_=DateTime), 1))).label("week"),
+    func.count(case((Order.routing_decision == "auto_process", 1))).label("auto"),
+    func.count(case((Order.routing_decision == "review", 1))).label("review"),
+    func.count(case((Order.routing_decision == "manual", 1))).label("manual"),
+    func.avg(Order.confidence_score).label("avg_confidence"),
+    func.avg(Order.processing_time_ms).label("avg_processing_time"),
+)
+
+CONFIDENCE_DISTRIBUTION_QUERY = select(
+    func.count(case((Order.overall_confidence == "high", 1))).label("high"),
+    func.count(case((Order.overall_confidence == "medium", 1))).label("medium"),
+    func.count(case((Order.overall_confidence == "low", 1))).label("low"),
+)
+
+# Dashboard polls the metrics endpoints every few seconds; serve them from memory
+# for a short window and drop them whenever an order is written.
+# Endpoint name -> (expires_at, response)
+METRICS_CACHE_TTL_SECONDS = 10.0
+_metrics_cache: dict[str, tuple[float, object]] = {}
+
+# Formatted order-history prompt context per (customer_name, organization hint).
+# History only changes when an order is written, which clears the cache.
+HISTORY_CACHE_TTL_SECONDS = 300.0
+HISTORY_CACHE_MAX_ENTRIES = 1024
+_history_cache: dict[tuple, tuple[float, str]] = {}
+
+
+def invalidate_order_caches() -> None:
+    """Drop cached metrics and order history after an order is written."""
+    _metrics_cache.clear()
+    _history_cache.clear()
+
+
+@lru_cache(maxsize=1)
+def get_order_processor() -> OrderProcessor:
+    """
+    Return the shared OrderProcessor.
+
+    The processor holds no per-request state and its Anthropic clients are
+    thread-safe, so one instance is reused across requests and worker threads.
+    """
+    return OrderProcessor()
+
+
+# Extractions currently running, keyed by their input. Identical concurrent
+# requests (e.g. a retried webhook delivery) share one LLM call.
+_inflight_extractions: dict[tuple[str, str], asyncio.Future] = {}
+
+
+async def extract_order(message: str, order_history_context: str = "") -> ProcessingResult:
+    """
+    Run the shared processor on a message without blocking the event loop.
+
+    The LLM calls block, so they run in the default thread pool. A request that
+    arrives while the same input is already being processed awaits that result
+    instead of starting a second extraction, and gets its own deep copy of the
+    result since callers may modify it.
+    """
+    key = (message, order_history_context)
+    pending = _inflight_extractions.get(key)
+    joined = pending is not None
+    if not joined:
+        processor = get_order_processor()
+        pending = asyncio.ensure_future(
+            asyncio.to_thread(processor.process, message, order_history_context=order_history_context)
+        )
+        _inflight_extractions[key] = pending
+        pending.add_done_callback(lambda _: _inflight_extractions.pop(key, None))
+    # Shield so one caller disconnecting doesn't cancel the others' result
+    result = await asyncio.shield(pending)
+    return result.model_copy(deep=True) if joined else result
+
 
 def get_routing_decision(confidence_score: float, requires_clarification: bool) -> str:
     """Determine routing based on confidence score."""
@@ -122,26 +239,65 @@ def get_routing_decision(confidence_score: float, requires_clarification: bool)
         return "manual"
 
 
+# (confidence level, requires_clarification) -> (confidence score, routing decision),
+# precomputed for every extraction outcome
+ROUTING_TABLE = {
+    (level.value, requires_clarification): (
+        confidence_to_score(level),
+        get_routing_decision(confidence_to_score(level), requires_clarification),
+    )
+    for level in ConfidenceLevel
+    for requires_clarification in (False, True)
+}
+
+# (field, default) pairs read from item dicts stored in JSON columns
+CUMULATIVE_ITEM_FIELDS = (
+    ("product_name", ""),
+    ("normalized_name", None),
+    ("quantity", 0),
+    ("unit", ""),
+    ("confidence", "medium"),
+    ("original_text", None),
+    ("notes", None),
+    ("modification_count", 0),
+    ("is_active", True),
+)
+TRACKED_CUMULATIVE_ITEM_FIELDS = CUMULATIVE_ITEM_FIELDS + (
+    ("first_mentioned_message_id", None),
+    ("last_modified_message_id", None),
+)
+ADDED_ITEM_SUMMARY_FIELDS = CUMULATIVE_ITEM_FIELDS[:1] + CUMULATIVE_ITEM_FIELDS[2:5]
+ITEM_CHANGE_FIELDS = (
+    ("product_name", ""),
+    ("old_quantity", None),
+    ("new_quantity", 0),
+    ("old_unit", None),
+    ("unit", ""),
+)
+# Snapshot history has never reported the previous unit
+SNAPSHOT_ITEM_CHANGE_FIELDS = ITEM_CHANGE_FIELDS[:3] + ITEM_CHANGE_FIELDS[4:]
+
+
+def cumulative_item_response(item: dict, fields=CUMULATIVE_ITEM_FIELDS) -> CumulativeItemResponse:
+    """Build a CumulativeItemResponse from a stored item dict without re-validating it."""
+    get = item.get
+    return CumulativeItemResponse.model_construct(**{name: get(name, default) for name, default in fields})
+
+
+def item_change_response(item: dict, fields=ITEM_CHANGE_FIELDS) -> ItemChangeResponse:
+    """Build an ItemChangeResponse from a stored change dict without re-validating it."""
+    get = item.get
+    return ItemChangeResponse.model_construct(**{name: get(name, default) for name, default in fields})
+
+
 def build_cumulative_state_response(state: CumulativeOrderState) -> CumulativeStateResponse:
     """Build CumulativeStateResponse from database model."""
     items = state.items_json.get("items", [])
-    return CumulativeStateResponse(
+    return CumulativeStateResponse.model_construct(
         id=state.id,
         conversation_id=state.conversation_id,
         items=[
-            CumulativeItemResponse(
-                product_name=item.get("product_name", ""),
-                normalized_name=item.get("normalized_name"),
-                quantity=item.get("quantity", 0),
-                unit=item.get("unit", ""),
-                confidence=item.get("confidence", "medium"),
-                original_text=item.get("original_text"),
-                notes=item.get("notes"),
-                modification_count=item.get("modification_count", 0),
-                is_active=item.get("is_active", True),
-                first_mentioned_message_id=item.get("first_mentioned_message_id"),
-                last_modified_message_id=item.get("last_modified_message_id"),
-            )
+            cumulative_item_response(item, TRACKED_CUMULATIVE_ITEM_FIELDS)
             for item in items
             if item.get("is_active", True)
         ],
@@ -159,35 +315,69 @@ def build_cumulative_state_response(state: CumulativeOrderState) -> CumulativeSt
 
 def build_changes_response(changes: dict) -> ChangesResponse:
     """Build ChangesResponse from changes dict."""
-    return ChangesResponse(
-        added=[
-            CumulativeItemResponse(
-                product_name=item.get("product_name", ""),
-                normalized_name=item.get("normalized_name"),
-                quantity=item.get("quantity", 0),
-                unit=item.get("unit", ""),
-                confidence=item.get("confidence", "medium"),
-                original_text=item.get("original_text"),
-                notes=item.get("notes"),
-                modification_count=item.get("modification_count", 0),
-                is_active=item.get("is_active", True),
-            )
-            for item in changes.get("added", [])
-        ],
-        modified=[
-            ItemChangeResponse(
-                product_name=item.get("product_name", ""),
-                old_quantity=item.get("old_quantity"),
-                new_quantity=item.get("new_quantity", 0),
-                old_unit=item.get("old_unit"),
-                unit=item.get("unit", ""),
-            )
-            for item in changes.get("modified", [])
-        ],
+    return ChangesResponse.model_construct(
+        added=[cumulative_item_response(item) for item in changes.get("added", [])],
+        modified=[item_change_response(item) for item in changes.get("modified", [])],
         unchanged=changes.get("unchanged", []),
     )
 
 
+def build_snapshot_response(snapshot: OrderSnapshot) -> SnapshotResponse:
+    """Build SnapshotResponse from database model."""
+    items = snapshot.items_json.get("items", [])
+    changes = snapshot.changes_json or {}
+    return SnapshotResponse.model_construct(
+        id=snapshot.id,
+        version=snapshot.version,
+        items=[cumulative_item_response(item) for item in items],
+        changes=ChangesResponse.model_construct(
+            added=[
+                cumulative_item_response(item, ADDED_ITEM_SUMMARY_FIELDS)
+                for item in changes.get("added", [])
+            ],
+            modified=[
+                item_change_response(item, SNAPSHOT_ITEM_CHANGE_FIELDS)
+                for item in changes.get("modified", [])
+            ],
+            unchanged=changes.get("unchanged", []),
+        ) if changes else None,
+        message_id=snapshot.message_id,
+        extraction_confidence=snapshot.extraction_confidence,
+        requires_clarification=snapshot.requires_clarification,
+        created_at=snapshot.created_at,
+    )
+
+
+async def get_order_history_context(
+    db: AsyncSession,
+    customer_name: Optional[str],
+    organization: Optional[str],
+) -> str:
+    """Return the formatted order-history context for a customer, cached briefly."""
+    key = (customer_name, organization)
+    cached = _history_cache.get(key)
+    if cached and time.monotonic() < cached[0]:
+        return cached[1]
+
+    history = await get_customer_order_history(
+        db,
+        customer_name=customer_name,
+        organization=organization,
+        limit=5,
+    )
+    frequent_items = await get_customer_frequent_items(
+        db,
+        customer_name=customer_name,
+        organization=organization,
+        limit=10,
+    )
+    context = format_order_history_context(history, frequent_items)
+    if len(_history_cache) >= HISTORY_CACHE_MAX_ENTRIES:
+        _history_cache.clear()
+    _history_cache[key] = (time.monotonic() + HISTORY_CACHE_TTL_SECONDS, context)
+    return context
+
+
 @router.post("/messages", response_model=ProcessMessageResponse)
 async def process_message(
     request: MessageCreate,
@@ -195,67 +385,41 @@ async def process_message(
 ):
     """Process a new WhatsApp message and extract order."""
     start_time = time.time()
+    received_at = datetime.utcnow()
 
-    # Create conversation
+    # Create conversation and customer message; both are written with the
+    # order in a single flush once processing is done
     conversation = Conversation(
         customer_name=request.customer_name,
         status="active",
+        created_at=received_at,
     )
-    db.add(conversation)
-    await db.flush()
-
-    # Add customer message
     customer_message = Message(
-        conversation_id=conversation.id,
+        conversation=conversation,
         role="customer",
         content=request.content,
         message_type=request.message_type,
+        created_at=received_at,
     )
-    db.add(customer_message)
-    await db.flush()
+    db.add_all([conversation, customer_message])
 
-    # Try to extract customer/organization for history lookup
-    # Simple pattern matching for common formats
+    # Try to identify organization from message for history lookup
     order_history_context = ""
-    message_lower = request.content.lower()
-
-    # Try to identify organization from message
-    organization_hints = None
-    for keyword in ["from ", "- ", "here at ", "at "]:
-        if keyword in message_lower:
-            # Extract potential organization name
-            parts = message_lower.split(keyword)
-            if len(parts) > 1:
-                # Take the part after the keyword, clean it up
-                potential_org = parts[-1].split(".")[0].split(",")[0].split("\n")[0].strip()
-                if len(potential_org) > 3 and len(potential_org) < 50:
-                    organization_hints = potential_org
-                    break
+    organization_hints = extract_organization_hint(request.content)
 
     # Fetch order history if we identified a potential customer
     if organization_hints or request.customer_name:
         try:
-            history = await get_customer_order_history(
-                db,
-                customer_name=request.customer_name,
-                organization=organization_hints,
-                limit=5,
+            order_history_context = await get_order_history_context(
+                db, request.customer_name, organization_hints
             )
-            frequent_items = await get_customer_frequent_items(
-                db,
-                customer_name=request.customer_name,
-                organization=organization_hints,
-                limit=10,
-            )
-            order_history_context = format_order_history_context(history, frequent_items)
         except Exception:
             # Don't fail if history lookup fails
             pass
 
     # Process the message
-    processor = OrderProcessor()
     try:
-        result = processor.process(request.content, order_history_context=order_history_context)
+        result = await extract_order(request.content, order_history_context)
     except Exception as e:
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"Processing error: {str(e)}")
@@ -265,7 +429,7 @@ async def process_message(
     if not result.success or not result.extracted_order:
         # Add error message
         error_message = Message(
-            conversation_id=conversation.id,
+            conversation=conversation,
             role="system",
             content=f"Failed to process order: {result.error}",
             message_type="text",
@@ -283,21 +447,20 @@ async def process_message(
     extracted = result.extracted_order
     erp_payload = result.erp_payload
 
-    # Calculate confidence score
-    confidence_map = {"high": 0.95, "medium": 0.75, "low": 0.50}
-    confidence_score = confidence_map.get(extracted.overall_confidence.value, 0.50)
+    # Confidence score and routing from the precomputed table
+    confidence_score, routing_decision = ROUTING_TABLE[
+        (extracted.overall_confidence.value, extracted.requires_clarification)
+    ]
 
-    # Determine routing
-    routing_decision = get_routing_decision(confidence_score, extracted.requires_clarification)
+    # Dump items once; reused for items_json and the extraction response
+    dumped_items = EXTRACTED_ITEMS_ADAPTER.dump_python(extracted.items, mode="json")
 
     # Create order record
     order = Order(
-        conversation_id=conversation.id,
+        conversation=conversation,
         customer_name=extracted.customer_name,
         organization=extracted.customer_organization,
-        items_json={
-            "items": [item.model_dump() for item in extracted.items],
-        },
+        items_json={"items": dumped_items},
         delivery_date=extracted.requested_delivery_date,
         urgency=extracted.delivery_urgency,
         confidence_score=confidence_score,
@@ -311,18 +474,25 @@ async def process_message(
         processing_time_ms=processing_time_ms,
     )
     db.add(order)
+    # One flush writes conversation, messages and order in dependency order
     await db.flush()
 
-    # Create order items for history
-    for item in extracted.items:
-        order_item = OrderItem(
-            order_id=order.id,
-            product_name=item.product_name,
-            quantity=item.quantity,
-            unit=item.unit,
-            confidence=item.confidence.value,
+    # Order items for history in a single executemany INSERT; as ORM objects
+    # SQLite would issue one INSERT ... RETURNING per row to fetch their ids
+    if extracted.items:
+        await db.execute(
+            insert(OrderItem),
+            [
+                {
+                    "order_id": order.id,
+                    "product_name": item.product_name,
+                    "quantity": item.quantity,
+                    "unit": item.unit,
+                    "confidence": item.confidence.value,
+                }
+                for item in extracted.items
+            ],
         )
-        db.add(order_item)
 
     # Initialize cumulative order state
     state_manager = OrderStateManager(db)
@@ -361,26 +531,17 @@ async def process_message(
     conversation.customer_name = extracted.customer_name
 
     await db.commit()
+    invalidate_order_caches()
 
     # Build cumulative state response
     cumulative_state_response = build_cumulative_state_response(cumulative_state)
     changes_response = build_changes_response(changes)
 
     # Build response
-    extraction_response = ExtractionResultResponse(
+    extraction_response = ExtractionResultResponse.model_construct(
         customer_name=extracted.customer_name,
         customer_organization=extracted.customer_organization,
-        items=[
-            ExtractedItemResponse(
-                product_name=item.product_name,
-                quantity=item.quantity,
-                unit=item.unit,
-                confidence=item.confidence.value,
-                original_text=item.original_text,
-                notes=item.notes,
-            )
-            for item in extracted.items
-        ],
+        items=[ExtractedItemResponse.model_construct(**item) for item in dumped_items],
         requested_delivery_date=extracted.requested_delivery_date,
         delivery_urgency=extracted.delivery_urgency,
         overall_confidence=extracted.overall_confidence.value,
@@ -394,7 +555,7 @@ async def process_message(
         message_id=customer_message.id,
         extraction=extraction_response,
         confirmation_message=result.confirmation_message,
-        order=OrderResponse(
+        order=OrderResponse.model_construct(
             id=order.id,
             customer_name=order.customer_name,
             organization=order.organization,
@@ -419,30 +580,49 @@ async def process_message(
 @router.get("/conversations", response_model=list[ConversationListItem])
 async def list_conversations(
     db: AsyncSession = Depends(get_db),
-    limit: int = 50,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
     offset: int = 0,
+    before: Optional[datetime] = None,
+    before_id: Optional[int] = None,
 ):
-    """List all conversations."""
+    """
+    List all conversations, most recently updated first.
+
+    Pass the last item's updated_at and id as `before` and `before_id` to fetch
+    the next page with an index seek; the id breaks ties between conversations
+    updated at the same instant. `offset` is kept for existing clients.
+    """
+    # Count messages in SQL rather than loading every message just to len() it
+    message_counts = (
+        select(Message.conversation_id, func.count(Message.id).label("message_count"))
+        .group_by(Message.conversation_id)
+        .subquery()
+    )
     query = (
-        select(Conversation)
-        .options(selectinload(Conversation.messages))
-        .order_by(Conversation.updated_at.desc())
+        select(Conversation, func.coalesce(message_counts.c.message_count, 0))
+        .outerjoin(message_counts, message_counts.c.conversation_id == Conversation.id)
+        .options(raiseload("*"))
+        .order_by(Conversation.updated_at.desc(), Conversation.id.desc())
         .offset(offset)
         .limit(limit)
     )
+    if before is not None:
+        if before_id is not None:
+            query = query.where(tuple_(Conversation.updated_at, Conversation.id) < (before, before_id))
+        else:
+            query = query.where(Conversation.updated_at < before)
     result = await db.execute(query)
-    conversations = result.scalars().all()
 
     return [
-        ConversationListItem(
+        ConversationListItem.model_construct(
             id=conv.id,
             customer_name=conv.customer_name,
             status=conv.status,
-            message_count=len(conv.messages),
+            message_count=message_count,
             created_at=conv.created_at,
             updated_at=conv.updated_at,
         )
-        for conv in conversations
+        for conv, message_count in result.all()
     ]
 
 
@@ -454,7 +634,7 @@ async def get_conversation(
     """Get a conversation with all messages."""
     query = (
         select(Conversation)
-        .options(selectinload(Conversation.messages), selectinload(Conversation.orders))
+        .options(selectinload(Conversation.messages), raiseload("*"))
         .where(Conversation.id == conversation_id)
     )
     result = await db.execute(query)
@@ -463,7 +643,15 @@ async def get_conversation(
     if not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    latest_order = conversation.orders[-1] if conversation.orders else None
+    # Fetch only the newest order instead of loading the full order history
+    latest_order_result = await db.execute(
+        select(Order)
+        .options(raiseload("*"))
+        .where(Order.conversation_id == conversation_id)
+        .order_by(Order.created_at.desc(), Order.id.desc())
+        .limit(1)
+    )
+    latest_order = latest_order_result.scalar_one_or_none()
 
     return ConversationResponse(
         id=conversation.id,
@@ -472,7 +660,7 @@ async def get_conversation(
         created_at=conversation.created_at,
         updated_at=conversation.updated_at,
         messages=[
-            MessageResponse(
+            MessageResponse.model_construct(
                 id=msg.id,
                 role=msg.role,
                 content=msg.content,
@@ -481,7 +669,7 @@ async def get_conversation(
             )
             for msg in conversation.messages
         ],
-        latest_order=OrderResponse(
+        latest_order=OrderResponse.model_construct(
             id=latest_order.id,
             customer_name=latest_order.customer_name,
             organization=latest_order.organization,
@@ -513,9 +701,11 @@ async def get_conversation_state(
         select(Conversation)
         .options(
             selectinload(Conversation.messages),
-            selectinload(Conversation.cumulative_state).selectinload(
+            # One-to-one, so a LEFT JOIN adds no rows and saves a round-trip
+            joinedload(Conversation.cumulative_state).selectinload(
                 CumulativeOrderState.snapshots
             ),
+            raiseload("*"),
         )
         .where(Conversation.id == conversation_id)
     )
@@ -527,68 +717,18 @@ async def get_conversation_state(
 
     # Build cumulative state response if exists
     cumulative_state_response = None
-    snapshots_response = []
+    snapshots = []
 
     if conversation.cumulative_state:
         cumulative_state_response = build_cumulative_state_response(conversation.cumulative_state)
-
-        # Build snapshots response
-        for snapshot in conversation.cumulative_state.snapshots:
-            items = snapshot.items_json.get("items", [])
-            changes = snapshot.changes_json or {}
-
-            snapshots_response.append(
-                SnapshotResponse(
-                    id=snapshot.id,
-                    version=snapshot.version,
-                    items=[
-                        CumulativeItemResponse(
-                            product_name=item.get("product_name", ""),
-                            normalized_name=item.get("normalized_name"),
-                            quantity=item.get("quantity", 0),
-                            unit=item.get("unit", ""),
-                            confidence=item.get("confidence", "medium"),
-                            original_text=item.get("original_text"),
-                            notes=item.get("notes"),
-                            modification_count=item.get("modification_count", 0),
-                            is_active=item.get("is_active", True),
-                        )
-                        for item in items
-                    ],
-                    changes=ChangesResponse(
-                        added=[
-                            CumulativeItemResponse(
-                                product_name=item.get("product_name", ""),
-                                quantity=item.get("quantity", 0),
-                                unit=item.get("unit", ""),
-                                confidence=item.get("confidence", "medium"),
-                            )
-                            for item in changes.get("added", [])
-                        ],
-                        modified=[
-                            ItemChangeResponse(
-                                product_name=item.get("product_name", ""),
-                                old_quantity=item.get("old_quantity"),
-                                new_quantity=item.get("new_quantity", 0),
-                                unit=item.get("unit", ""),
-                            )
-                            for item in changes.get("modified", [])
-                        ],
-                        unchanged=changes.get("unchanged", []),
-                    ) if changes else None,
-                    message_id=snapshot.message_id,
-                    extraction_confidence=snapshot.extraction_confidence,
-                    requires_clarification=snapshot.requires_clarification,
-                    created_at=snapshot.created_at,
-                )
-            )
+        snapshots = conversation.cumulative_state.snapshots
 
     return ConversationStateResponse(
         conversation_id=conversation.id,
         customer_name=conversation.customer_name,
         status=conversation.status,
         messages=[
-            MessageResponse(
+            MessageResponse.model_construct(
                 id=msg.id,
                 role=msg.role,
                 content=msg.content,
@@ -598,7 +738,7 @@ async def get_conversation_state(
             for msg in conversation.messages
         ],
         cumulative_state=cumulative_state_response,
-        snapshots=snapshots_response,
+        snapshots=[build_snapshot_response(snapshot) for snapshot in snapshots],
         created_at=conversation.created_at,
         updated_at=conversation.updated_at,
     )
@@ -616,7 +756,7 @@ async def submit_clarification(
     # Get conversation with messages
     query = (
         select(Conversation)
-        .options(selectinload(Conversation.messages), selectinload(Conversation.orders))
+        .options(selectinload(Conversation.messages))
         .where(Conversation.id == conversation_id)
     )
     result = await db.execute(query)
@@ -629,15 +769,15 @@ async def submit_clarification(
     state_manager = OrderStateManager(db)
     cumulative_state = await state_manager.get_or_create_state(conversation_id)
 
-    # Add clarification message
+    # Add clarification message; it is flushed together with the new order
     clarification_message = Message(
         conversation_id=conversation.id,
         role="customer",
         content=request.content,
         message_type="clarification",
+        created_at=datetime.utcnow(),
     )
     db.add(clarification_message)
-    await db.flush()
 
     # Build FULL context with current state and all messages
     full_context = state_manager.build_full_context(conversation.messages, cumulative_state)
@@ -655,9 +795,8 @@ If adding new items, include them.
 Preserve items from current state that aren't being modified."""
 
     # Reprocess with full context
-    processor = OrderProcessor()
     try:
-        result = processor.process(enhanced_message)
+        result = await extract_order(enhanced_message)
     except Exception as e:
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"Processing error: {str(e)}")
@@ -665,6 +804,7 @@ Preserve items from current state that aren't being modified."""
     processing_time_ms = int((time.time() - start_time) * 1000)
 
     if not result.success or not result.extracted_order:
+        await db.flush()
         return ProcessMessageResponse(
             conversation_id=conversation.id,
             message_id=clarification_message.id,
@@ -674,16 +814,19 @@ Preserve items from current state that aren't being modified."""
     extracted = result.extracted_order
     erp_payload = result.erp_payload
 
-    confidence_map = {"high": 0.95, "medium": 0.75, "low": 0.50}
-    confidence_score = confidence_map.get(extracted.overall_confidence.value, 0.50)
-    routing_decision = get_routing_decision(confidence_score, extracted.requires_clarification)
+    confidence_score, routing_decision = ROUTING_TABLE[
+        (extracted.overall_confidence.value, extracted.requires_clarification)
+    ]
+
+    # Dump items once; reused for items_json and the extraction response
+    dumped_items = EXTRACTED_ITEMS_ADAPTER.dump_python(extracted.items, mode="json")
 
     # Create new order record
     order = Order(
         conversation_id=conversation.id,
         customer_name=extracted.customer_name,
         organization=extracted.customer_organization,
-        items_json={"items": [item.model_dump() for item in extracted.items]},
+        items_json={"items": dumped_items},
         delivery_date=extracted.requested_delivery_date,
         urgency=extracted.delivery_urgency,
         confidence_score=confidence_score,
@@ -727,25 +870,16 @@ Preserve items from current state that aren't being modified."""
     # Update conversation status
     conversation.status = "completed" if not extracted.requires_clarification else "needs_clarification"
     await db.commit()
+    invalidate_order_caches()
 
     # Build cumulative state response
     cumulative_state_response = build_cumulative_state_response(cumulative_state)
     changes_response = build_changes_response(changes)
 
-    extraction_response = ExtractionResultResponse(
+    extraction_response = ExtractionResultResponse.model_construct(
         customer_name=extracted.customer_name,
         customer_organization=extracted.customer_organization,
-        items=[
-            ExtractedItemResponse(
-                product_name=item.product_name,
-                quantity=item.quantity,
-                unit=item.unit,
-                confidence=item.confidence.value,
-                original_text=item.original_text,
-                notes=item.notes,
-            )
-            for item in extracted.items
-        ],
+        items=[ExtractedItemResponse.model_construct(**item) for item in dumped_items],
         requested_delivery_date=extracted.requested_delivery_date,
         delivery_urgency=extracted.delivery_urgency,
         overall_confidence=extracted.overall_confidence.value,
@@ -759,7 +893,7 @@ Preserve items from current state that aren't being modified."""
         message_id=clarification_message.id,
         extraction=extraction_response,
         confirmation_message=result.confirmation_message,
-        order=OrderResponse(
+        order=OrderResponse.model_construct(
             id=order.id,
             customer_name=order.customer_name,
             organization=order.organization,
@@ -785,89 +919,64 @@ Preserve items from current state that aren't being modified."""
 async def list_orders(
     db: AsyncSession = Depends(get_db),
     status: Optional[str] = None,
-    limit: int = 50,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
     offset: int = 0,
+    before: Optional[datetime] = None,
+    before_id: Optional[int] = None,
 ):
-    """List orders with optional status filter."""
-    query = select(Order).order_by(Order.created_at.desc())
+    """
+    List orders with optional status filter, newest first.
+
+    Pass the last item's created_at and id as `before` and `before_id` to fetch
+    the next page with an index seek; the id breaks ties between orders created
+    at the same instant. `offset` is kept for existing clients.
+    """
+    query = select(*ORDER_RESPONSE_COLUMNS).order_by(Order.created_at.desc(), Order.id.desc())
 
     if status:
         query = query.where(Order.status == status)
+    if before is not None:
+        if before_id is not None:
+            query = query.where(tuple_(Order.created_at, Order.id) < (before, before_id))
+        else:
+            query = query.where(Order.created_at < before)
 
     query = query.offset(offset).limit(limit)
     result = await db.execute(query)
-    orders = result.scalars().all()
 
-    return [
-        OrderResponse(
-            id=order.id,
-            customer_name=order.customer_name,
-            organization=order.organization,
-            items_json=order.items_json,
-            delivery_date=order.delivery_date,
-            confidence_score=order.confidence_score,
-            overall_confidence=order.overall_confidence,
-            requires_review=order.requires_review,
-            requires_clarification=order.requires_clarification,
-            status=order.status,
-            routing_decision=order.routing_decision,
-            erp_order_id=order.erp_order_id,
-            processing_time_ms=order.processing_time_ms,
-            created_at=order.created_at,
-        )
-        for order in orders
-    ]
+    return result.all()
 
 
 @router.get("/metrics/summary", response_model=MetricsSummary)
 async def get_metrics_summary(db: AsyncSession = Depends(get_db)):
     """Get dashboard metrics summary."""
+    cached = _metrics_cache.get("summary")
+    if cached and time.monotonic() < cached[0]:
+        return cached[1]
+
     now = datetime.utcnow()
     today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
     week_start = today_start - timedelta(days=now.weekday())
 
-    # Total orders
-    total_result = await db.execute(select(func.count(Order.id)))
-    total_orders = total_result.scalar() or 0
-
-    # Orders today
-    today_result = await db.execute(
-        select(func.count(Order.id)).where(Order.created_at >= today_start)
-    )
-    orders_today = today_result.scalar() or 0
-
-    # Orders this week
-    week_result = await db.execute(
-        select(func.count(Order.id)).where(Order.created_at >= week_start)
-    )
-    orders_this_week = week_result.scalar() or 0
-
-    # Routing counts
-    auto_result = await db.execute(
-        select(func.count(Order.id)).where(Order.routing_decision == "auto_process")
-    )
-    auto_processed_count = auto_result.scalar() or 0
-
-    review_result = await db.execute(
-        select(func.count(Order.id)).where(Order.routing_decision == "review")
-    )
-    review_queue_count = review_result.scalar() or 0
+    stats = (
+        await db.execute(
+            METRICS_SUMMARY_QUERY,
+            {"today_start": today_start, "week_start": week_start},
+        )
+    ).one()
 
-    manual_result = await db.execute(
-        select(func.count(Order.id)).where(Order.routing_decision == "manual")
-    )
-    manual_count = manual_result.scalar() or 0
+    total_orders = stats.total or 0
+    orders_today = stats.today or 0
+    orders_this_week = stats.week or 0
+    auto_processed_count = stats.auto or 0
+    review_queue_count = stats.review or 0
+    manual_count = stats.manual or 0
 
     # Auto process rate
     auto_process_rate = (auto_processed_count / total_orders * 100) if total_orders > 0 else 0
 
-    # Average confidence
-    avg_conf_result = await db.execute(select(func.avg(Order.confidence_score)))
-    average_confidence = avg_conf_result.scalar() or 0
-
-    # Average processing time
-    avg_time_result = await db.execute(select(func.avg(Order.processing_time_ms)))
-    average_processing_time_ms = avg_time_result.scalar() or 0
+    average_confidence = stats.avg_confidence or 0
+    average_processing_time_ms = stats.avg_processing_time or 0
 
     # Time saved (assuming 3 minutes manual processing per order)
     manual_time_per_order_minutes = 3
@@ -875,7 +984,7 @@ async def get_metrics_summary(db: AsyncSession = Depends(get_db)):
         total_orders * (average_processing_time_ms / 60000)
     )
 
-    return MetricsSummary(
+    summary = MetricsSummary(
         total_orders=total_orders,
         orders_today=orders_today,
         orders_this_week=orders_this_week,
@@ -887,69 +996,53 @@ async def get_metrics_summary(db: AsyncSession = Depends(get_db)):
         average_processing_time_ms=round(average_processing_time_ms, 0),
         total_time_saved_minutes=round(max(0, total_time_saved_minutes), 1),
     )
+    _metrics_cache["summary"] = (time.monotonic() + METRICS_CACHE_TTL_SECONDS, summary)
+    return summary
 
 
 @router.get("/metrics/confidence", response_model=ConfidenceDistribution)
 async def get_confidence_distribution(db: AsyncSession = Depends(get_db)):
     """Get distribution of confidence levels."""
-    high_result = await db.execute(
-        select(func.count(Order.id)).where(Order.overall_confidence == "high")
-    )
-    high = high_result.scalar() or 0
+    cached = _metrics_cache.get("confidence")
+    if cached and time.monotonic() < cached[0]:
+        return cached[1]
 
-    medium_result = await db.execute(
-        select(func.count(Order.id)).where(Order.overall_confidence == "medium")
-    )
-    medium = medium_result.scalar() or 0
+    counts = (await db.execute(CONFIDENCE_DISTRIBUTION_QUERY)).one()
+    high = counts.high or 0
+    medium = counts.medium or 0
+    low = counts.low or 0
 
-    low_result = await db.execute(
-        select(func.count(Order.id)).where(Order.overall_confidence == "low")
-    )
-    low = low_result.scalar() or 0
-
-    return ConfidenceDistribution(high=high, medium=medium, low=low)
+    distribution = ConfidenceDistribution(high=high, medium=medium, low=low)
+    _metrics_cache["confidence"] = (time.monotonic() + METRICS_CACHE_TTL_SECONDS, distribution)
+    return distribution
 
 
 @router.get("/customers", response_model=list[CustomerResponse])
 async def list_customers(db: AsyncSession = Depends(get_db)):
     """List all customers."""
-    result = await db.execute(select(Customer).order_by(Customer.name))
-    customers = result.scalars().all()
-    return [
-        CustomerResponse(
-            id=c.id,
-            name=c.name,
-            organization=c.organization,
-            phone=c.phone,
-            tier=c.tier,
-            region=c.region,
-        )
-        for c in customers
-    ]
+    result = await db.execute(LIST_CUSTOMERS_QUERY)
+    return result.all()
 
 
 @router.get("/products", response_model=list[ProductResponse])
 async def list_products(db: AsyncSession = Depends(get_db)):
     """List all products."""
-    result = await db.execute(select(Product).order_by(Product.category, Product.name))
-    products = result.scalars().all()
-    return [
-        ProductResponse(
-            id=p.id,
-            name=p.name,
-            category=p.category,
-            unit=p.unit,
-            price=p.price,
-            in_stock=p.in_stock,
-        )
-        for p in products
-    ]
+    result = await db.execute(LIST_PRODUCTS_QUERY)
+    return result.all()
 
 
 @router.get("/samples", response_model=list[SampleMessage])
-async def get_sample_messages():
+async def get_sample_messages(if_none_match: Optional[str] = Header(None)):
     """Get sample messages for the gallery."""
-    return SAMPLE_MESSAGES
+    if if_none_match == SAMPLE_MESSAGES_ETAG:
+        return Response(status_code=304, headers=SAMPLE_MESSAGES_HEADERS)
+    # Returning a Response directly bypasses response_model serialization;
+    # the model stays declared for the OpenAPI schema.
+    return Response(
+        content=SAMPLE_MESSAGES_JSON,
+        media_type="application/json",
+        headers=SAMPLE_MESSAGES_HEADERS,
+    )
 
 
 @router.post("/excel-order", response_model=ExcelOrderResponse)
@@ -976,14 +1069,16 @@ async def process_excel_order(
             detail="Invalid file type. Please upload an Excel file (.xlsx or .xls)"
         )
 
-    # Read file content
-    try:
-        content = await file.read()
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Failed to read file: {str(e)}")
+    if file.size is not None and file.size > MAX_EXCEL_UPLOAD_BYTES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Excel file too large (max {MAX_EXCEL_UPLOAD_BYTES // (1024 * 1024)} MB)"
+        )
 
-    # Parse Excel file
-    result = parse_excel_order(content, filename=file.filename, customer_name=customer_name)
+    # Parse Excel file straight from the upload's spooled temporary file rather
+    # than copying it into memory; openpyxl is synchronous, so keep it off the
+    # event loop
+    result = await asyncio.to_thread(parse_excel_order, file.file, file.filename, customer_name)
 
     if not result.success:
         return ExcelOrderResponse(
@@ -996,27 +1091,26 @@ async def process_excel_order(
     order_text = excel_order_to_text(result)
 
     # Create conversation for this Excel order
+    received_at = datetime.utcnow()
     conversation = Conversation(
         customer_name=customer_name or result.customer_name or "Excel Order",
         status="active",
+        created_at=received_at,
     )
-    db.add(conversation)
-    await db.flush()
 
-    # Add the Excel order as a message
+    # Add the Excel order as a message; written with the order after processing
     excel_message = Message(
-        conversation_id=conversation.id,
+        conversation=conversation,
         role="customer",
         content=f"[Excel Order: {file.filename}]\n\n{order_text}",
         message_type="excel_order",
+        created_at=received_at,
     )
-    db.add(excel_message)
-    await db.flush()
+    db.add_all([conversation, excel_message])
 
     # Process through the standard order processor for confirmation
-    processor = OrderProcessor()
     try:
-        process_result = processor.process(order_text)
+        process_result = await extract_order(order_text)
     except Exception as e:
         await db.rollback()
         return ExcelOrderResponse(
@@ -1024,10 +1118,10 @@ async def process_excel_order(
             filename=file.filename,
             customer_name=customer_name,
             sheets=[
-                ExcelOrderSheetResponse(
+                ExcelOrderSheetResponse.model_construct(
                     category=s.category,
                     items=[
-                        ExcelOrderItemResponse(
+                        ExcelOrderItemResponse.model_construct(
                             category=i.category,
                             subcategory=i.subcategory,
                             product_name=i.product_name,
@@ -1052,19 +1146,69 @@ async def process_excel_order(
 
     processing_time_ms = int((time.time() - start_time) * 1000)
 
+    # Single pass over the parsed rows building every per-item representation
+    # (order payload, cumulative rows, snapshot changes, summary lines)
+    items_payload = []
+    cum_item_rows = []
+    added_changes = []
+    summary_lines = [f"*Order Summary - {file.filename}*\n"]
+    for sheet in result.sheets:
+        summary_lines.append(f"\n*{sheet.category}* ({sheet.total_items} items)")
+        for item in sheet.items:
+            product_name, quantity, unit, price = item.product_name, item.quantity, item.unit, item.price
+            items_payload.append({
+                "category": item.category,
+                "subcategory": item.subcategory,
+                "product_name": product_name,
+                "quantity": quantity,
+                "unit": unit,
+                "price": price,
+            })
+
+            # Each string is formatted once; the price text is shared by both
+            notes = f"Category: {item.category}"
+            if item.subcategory:
+                notes = f"{notes}, Subcategory: {item.subcategory}"
+            if price:
+                price_text = f"KES {price:,.0f}"
+                notes = f"{notes}, Price: {price_text}"
+                summary_lines.append(f"  • {product_name}: {quantity} {unit} @ {price_text}")
+            else:
+                summary_lines.append(f"  • {product_name}: {quantity} {unit}")
+
+            # Message ids are filled in once the Excel message is flushed
+            cum_item_rows.append({
+                "product_name": product_name,
+                "normalized_name": normalize_product_name(product_name),
+                "quantity": quantity,
+                "unit": unit,
+                "confidence": "high",  # Excel data is structured
+                "notes": notes,
+                "modification_count": 0,
+                "is_active": True,
+            })
+            added_changes.append({
+                "product_name": product_name,
+                "quantity": quantity,
+                "unit": unit,
+                "confidence": "high",
+            })
+        if sheet.total_value:
+            summary_lines.append(f"  _Subtotal: KES {sheet.total_value:,.0f}_")
+
     # Calculate confidence based on data quality
     # Check for missing prices, unclear units, etc.
-    items_with_price = sum(1 for s in result.sheets for i in s.items if i.price is not None)
     total_items = result.total_items
-    price_coverage = items_with_price / total_items if total_items > 0 else 0
+    price_coverage = result.items_with_price / total_items if total_items > 0 else 0
 
     # Use LLM extraction result for confidence if available
     if process_result.success and process_result.extracted_order:
         extracted = process_result.extracted_order
-        confidence_map = {"high": 0.95, "medium": 0.75, "low": 0.50}
-        confidence_score = confidence_map.get(extracted.overall_confidence.value, 0.75)
         overall_confidence = extracted.overall_confidence.value
         requires_clarification = extracted.requires_clarification
+        confidence_score, routing_decision = ROUTING_TABLE[
+            (overall_confidence, requires_clarification)
+        ]
     else:
         # Fallback: base confidence on data completeness
         if price_coverage >= 0.9 and total_items > 0:
@@ -1077,29 +1221,17 @@ async def process_excel_order(
             confidence_score = 0.65
             overall_confidence = "medium"
         requires_clarification = False
-
-    routing_decision = get_routing_decision(confidence_score, requires_clarification)
+        routing_decision = get_routing_decision(confidence_score, requires_clarification)
 
     order = Order(
-        conversation_id=conversation.id,
+        conversation=conversation,
         customer_name=customer_name or result.customer_name or "Excel Order",
         organization=customer_name,
         items_json={
             "source": "excel",
             "filename": file.filename,
             "categories": [s.category for s in result.sheets],
-            "items": [
-                {
-                    "category": item.category,
-                    "subcategory": item.subcategory,
-                    "product_name": item.product_name,
-                    "quantity": item.quantity,
-                    "unit": item.unit,
-                    "price": item.price,
-                }
-                for sheet in result.sheets
-                for item in sheet.items
-            ],
+            "items": items_payload,
         },
         confidence_score=confidence_score,
         overall_confidence=overall_confidence,
@@ -1110,119 +1242,73 @@ async def process_excel_order(
         processing_time_ms=processing_time_ms,
     )
     db.add(order)
+    # Writes conversation, Excel message and order; the message id is needed
+    # below for item tracking
     await db.flush()
 
-    # Create order items for history tracking
-    for sheet in result.sheets:
-        for item in sheet.items:
-            order_item = OrderItem(
-                order_id=order.id,
-                product_name=item.product_name,
-                quantity=item.quantity,
-                unit=item.unit,
-                confidence=overall_confidence,
-            )
-            db.add(order_item)
+    # Order items for history tracking in a single executemany INSERT; as ORM
+    # objects SQLite would issue one INSERT ... RETURNING per row
+    await db.execute(
+        insert(OrderItem),
+        [
+            {
+                "order_id": order.id,
+                "product_name": row["product_name"],
+                "quantity": row["quantity"],
+                "unit": row["unit"],
+                "confidence": overall_confidence,
+            }
+            for row in items_payload
+        ],
+    )
 
-    # Initialize cumulative state from Excel items
-    state_manager = OrderStateManager(db)
-    cumulative_state = await state_manager.get_or_create_state(conversation.id)
+    # Cumulative state for the new conversation, with its initial snapshot
+    cumulative_state = CumulativeOrderState(conversation=conversation)
+    db.add(cumulative_state)
 
-    # Populate cumulative items from Excel
-    added_items = []
-    for sheet in result.sheets:
-        for item in sheet.items:
-            notes = f"Category: {item.category}"
-            if item.subcategory:
-                notes += f", Subcategory: {item.subcategory}"
-            if item.price:
-                notes += f", Price: KES {item.price:,.0f}"
-
-            cum_item = CumulativeOrderItem(
-                cumulative_state_id=cumulative_state.id,
-                product_name=item.product_name,
-                normalized_name=state_manager.normalize_product_name(item.product_name),
-                quantity=item.quantity,
-                unit=item.unit,
-                confidence="high",  # Excel data is structured
-                notes=notes,
-                first_mentioned_message_id=excel_message.id,
-                last_modified_message_id=excel_message.id,
-                modification_count=0,
-                is_active=True,
-            )
-            db.add(cum_item)
-            added_items.append(cum_item)
+    # Cumulative item rows from Excel; each row doubles as its items_json entry
+    for row in cum_item_rows:
+        row["first_mentioned_message_id"] = row["last_modified_message_id"] = excel_message.id
 
     # Update cumulative state metadata and items_json
     cumulative_state.customer_name = customer_name or result.customer_name
     cumulative_state.overall_confidence = overall_confidence
     cumulative_state.version = 1
-    cumulative_state.items_json = {
-        "items": [
-            {
-                "product_name": item.product_name,
-                "normalized_name": item.normalized_name,
-                "quantity": item.quantity,
-                "unit": item.unit,
-                "confidence": "high",
-                "notes": item.notes,
-                "modification_count": 0,
-                "is_active": True,
-                "first_mentioned_message_id": excel_message.id,
-                "last_modified_message_id": excel_message.id,
-            }
-            for item in added_items
-        ]
-    }
-    await db.flush()
+    cumulative_state.items_json = {"items": cum_item_rows}
 
     # Create initial snapshot
     changes = {
-        "added": [
-            {
-                "product_name": item.product_name,
-                "quantity": item.quantity,
-                "unit": item.unit,
-                "confidence": "high",
-            }
-            for item in added_items
-        ],
+        "added": added_changes,
         "modified": [],
         "unchanged": [],
     }
     snapshot = OrderSnapshot(
-        cumulative_state_id=cumulative_state.id,
         message_id=excel_message.id,
+        # Own list and dicts so the snapshot never aliases the state's items_json
         items_json={"items": [
             {
-                "product_name": item.product_name,
-                "quantity": item.quantity,
-                "unit": item.unit,
-                "confidence": "high",
-                "notes": item.notes,
+                "product_name": row["product_name"],
+                "quantity": row["quantity"],
+                "unit": row["unit"],
+                "confidence": row["confidence"],
+                "notes": row["notes"],
             }
-            for item in added_items
+            for row in cum_item_rows
         ]},
         changes_json=changes,
         version=1,
         extraction_confidence=overall_confidence,
         requires_clarification=requires_clarification,
     )
-    db.add(snapshot)
-
-    # Generate detailed summary message
-    summary_lines = [f"*Order Summary - {file.filename}*\n"]
-    for sheet in result.sheets:
-        summary_lines.append(f"\n*{sheet.category}* ({sheet.total_items} items)")
-        for item in sheet.items:
-            line = f"  • {item.product_name}: {item.quantity} {item.unit}"
-            if item.price:
-                line += f" @ KES {item.price:,.0f}"
-            summary_lines.append(line)
-        if sheet.total_value:
-            summary_lines.append(f"  _Subtotal: KES {sheet.total_value:,.0f}_")
+    cumulative_state.snapshots = [snapshot]
+    # Writes the state and snapshot; the state id keys the cumulative items
+    await db.flush()
+    await db.execute(
+        insert(CumulativeOrderItem),
+        [{**row, "cumulative_state_id": cumulative_state.id} for row in cum_item_rows],
+    )
 
+    # Finish the detailed summary message started in the item pass
     summary_lines.append(f"\n*Total Items:* {result.total_items}")
     if result.total_value:
         summary_lines.append(f"*Total Value:* KES {result.total_value:,.0f}")
@@ -1261,6 +1347,7 @@ async def process_excel_order(
 
     conversation.status = "completed" if not requires_clarification else "needs_clarification"
     await db.commit()
+    invalidate_order_caches()
 
     # Build cumulative state response
     cum_state_response = build_cumulative_state_response(cumulative_state)
@@ -1270,10 +1357,10 @@ async def process_excel_order(
         filename=file.filename,
         customer_name=customer_name or result.customer_name,
         sheets=[
-            ExcelOrderSheetResponse(
+            ExcelOrderSheetResponse.model_construct(
                 category=s.category,
                 items=[
-                    ExcelOrderItemResponse(
+                    ExcelOrderItemResponse.model_construct(
                         category=i.category,
                         subcategory=i.subcategory,
                         product_name=i.product_name,
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # Request schemas
@@ -27,8 +27,7 @@ class MessageResponse(BaseModel):
     message_type: str
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ExtractedItemResponse(BaseModel):
@@ -71,8 +70,7 @@ class OrderResponse(BaseModel):
     processing_time_ms: Optional[int]
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ConversationResponse(BaseModel):
@@ -85,8 +83,7 @@ class ConversationResponse(BaseModel):
     messages: list[MessageResponse] = []
     latest_order: Optional[OrderResponse] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ConversationListItem(BaseModel):
@@ -98,8 +95,67 @@ class ConversationListItem(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Cumulative order state schemas
+class CumulativeItemResponse(BaseModel):
+    """An item in the cumulative order state."""
+    product_name: str
+    normalized_name: Optional[str] = None
+    quantity: float
+    unit: str
+    confidence: str
+    original_text: Optional[str] = None
+    notes: Optional[str] = None
+    modification_count: int = 0
+    is_active: bool = True
+    first_mentioned_message_id: Optional[int] = None
+    last_modified_message_id: Optional[int] = None
+
+
+class ItemChangeResponse(BaseModel):
+    """A change to an item (for modified items)."""
+    product_name: str
+    old_quantity: Optional[float] = None
+    new_quantity: float
+    old_unit: Optional[str] = None
+    unit: str
+
+
+class ChangesResponse(BaseModel):
+    """Changes made in an extraction."""
+    added: list[CumulativeItemResponse] = []
+    modified: list[ItemChangeResponse] = []
+    unchanged: list[dict] = []
+
+
+class SnapshotResponse(BaseModel):
+    """A snapshot of order state at a point in time."""
+    id: int
+    version: int
+    items: list[CumulativeItemResponse]
+    changes: Optional[ChangesResponse] = None
+    message_id: int
+    extraction_confidence: Optional[str] = None
+    requires_clarification: bool = False
+    created_at: datetime
+
+
+class CumulativeStateResponse(BaseModel):
+    """Current cumulative order state."""
+    id: int
+    conversation_id: int
+    items: list[CumulativeItemResponse]
+    customer_name: Optional[str] = None
+    customer_organization: Optional[str] = None
+    delivery_date: Optional[str] = None
+    urgency: Optional[str] = None
+    overall_confidence: str
+    requires_clarification: bool
+    pending_clarifications: list[str] = []
+    version: int
+    last_updated_at: Optional[datetime] = None
 
 
 class ProcessMessageResponse(BaseModel):
@@ -112,8 +168,8 @@ class ProcessMessageResponse(BaseModel):
     routing_decision: Optional[str] = None
     error: Optional[str] = None
     # Cumulative state fields
-    cumulative_state: Optional["CumulativeStateResponse"] = None
-    changes: Optional["ChangesResponse"] = None
+    cumulative_state: Optional[CumulativeStateResponse] = None
+    changes: Optional[ChangesResponse] = None
 
 
 class MetricsSummary(BaseModel):
@@ -146,8 +202,7 @@ class CustomerResponse(BaseModel):
     tier: str
     region: Optional[str]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ProductResponse(BaseModel):
@@ -159,8 +214,7 @@ class ProductResponse(BaseModel):
     price: float
     in_stock: bool
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class SampleMessage(BaseModel):
@@ -213,67 +267,7 @@ class ExcelOrderResponse(BaseModel):
     confidence_score: Optional[float] = None
     overall_confidence: Optional[str] = None
     # Cumulative state for ExtractionPanel display and follow-up modifications
-    cumulative_state: Optional["CumulativeStateResponse"] = None
-
-
-# Cumulative order state schemas
-class CumulativeItemResponse(BaseModel):
-    """An item in the cumulative order state."""
-    product_name: str
-    normalized_name: Optional[str] = None
-    quantity: float
-    unit: str
-    confidence: str
-    original_text: Optional[str] = None
-    notes: Optional[str] = None
-    modification_count: int = 0
-    is_active: bool = True
-    first_mentioned_message_id: Optional[int] = None
-    last_modified_message_id: Optional[int] = None
-
-
-class ItemChangeResponse(BaseModel):
-    """A change to an item (for modified items)."""
-    product_name: str
-    old_quantity: Optional[float] = None
-    new_quantity: float
-    old_unit: Optional[str] = None
-    unit: str
-
-
-class ChangesResponse(BaseModel):
-    """Changes made in an extraction."""
-    added: list[CumulativeItemResponse] = []
-    modified: list[ItemChangeResponse] = []
-    unchanged: list[dict] = []
-
-
-class SnapshotResponse(BaseModel):
-    """A snapshot of order state at a point in time."""
-    id: int
-    version: int
-    items: list[CumulativeItemResponse]
-    changes: Optional[ChangesResponse] = None
-    message_id: int
-    extraction_confidence: Optional[str] = None
-    requires_clarification: bool = False
-    created_at: datetime
-
-
-class CumulativeStateResponse(BaseModel):
-    """Current cumulative order state."""
-    id: int
-    conversation_id: int
-    items: list[CumulativeItemResponse]
-    customer_name: Optional[str] = None
-    customer_organization: Optional[str] = None
-    delivery_date: Optional[str] = None
-    urgency: Optional[str] = None
-    overall_confidence: str
-    requires_clarification: bool
-    pending_clarifications: list[str] = []
-    version: int
-    last_updated_at: Optional[datetime] = None
+    cumulative_state: Optional[CumulativeStateResponse] = None
 
 
 class ConversationStateResponse(BaseModel):
@@ -286,7 +280,3 @@ class ConversationStateResponse(BaseModel):
     snapshots: list[SnapshotResponse] = []
     created_at: datetime
     updated_at: datetime
-
-
-# Rebuild models to resolve forward references
-ProcessMessageResponse.model_rebuild()
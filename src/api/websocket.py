@@ -1,8 +1,8 @@
 """WebSocket handlers for real-time updates."""
 
-import json
 import asyncio
 from typing import Set
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 
 
@@ -21,20 +21,24 @@ class ConnectionManager:
 
     async def broadcast(self, message: dict):
         """Send message to all connected clients."""
-        disconnected = set()
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception:
-                disconnected.add(connection)
-
-        for conn in disconnected:
-            self.active_connections.discard(conn)
+        # Encode once for every client; sent as a text frame like send_json
+        payload = orjson.dumps(message).decode()
+        # Send to all clients concurrently, so one slow client doesn't delay the
+        # rest; snapshot the set since clients may connect while sends are pending
+        connections = tuple(self.active_connections)
+        results = await asyncio.gather(
+            *(connection.send_text(payload) for connection in connections),
+            return_exceptions=True,
+        )
+
+        for conn, result in zip(connections, results):
+            if isinstance(result, Exception):
+                self.active_connections.discard(conn)
 
     async def send_to(self, websocket: WebSocket, message: dict):
         """Send message to specific client."""
         try:
-            await websocket.send_json(message)
+            await websocket.send_text(orjson.dumps(message).decode())
         except Exception:
             self.active_connections.discard(websocket)
 
@@ -49,7 +53,7 @@ async def websocket_endpoint(websocket: WebSocket):
         while True:
             # Receive messages from client
             data = await websocket.receive_text()
-            message = json.loads(data)
+            message = orjson.loads(data)
 
             # Handle different message types
             if message.get("type") == "ping":
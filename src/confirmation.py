@@ -39,12 +39,64 @@ If clarification is needed:
 - Don't make assumptions about vague items"""
 
 
+# Template-based confirmations (no LLM call), keyed by detected language:
+# (message, clarification block, delivery text when no date was given)
+SIMPLE_CONFIRMATION_TEMPLATES = {
+    DetectedLanguage.SWAHILI: (
+        """Habari {customer_name}!
+
+Asante sana kwa oda yako kutoka *{customer}*.
+
+*Muhtasari wa Oda:*
+{items_list}
+
+*Uwasilishaji:* {delivery}
+
+Tutahibitisha upatikanaji na kuwasiliana nawe hivi karibuni. Jibu ujumbe huu ikiwa unahitaji kufanya mabadiliko yoyote.
+
+- Timu ya Kijani Supplies""",
+        """
+
+*Swali:*
+Tunahitaji maelezo zaidi kuhusu:
+{clarifications}
+
+Tafadhali jibu na maelezo ili tukamilishe oda yako.""",
+        "itahibitishwa",
+    ),
+    DetectedLanguage.ENGLISH: (
+        """Hi {customer_name}!
+
+Thank you for your order from *{customer}*.
+
+*Order Summary:*
+{items_list}
+
+*Delivery:* {delivery}
+
+We'll confirm availability and get back to you shortly. Reply to this message if you need to make any changes.
+
+- Kijani Supplies Team""",
+        """
+
+*Quick question:*
+We need a bit more info on:
+{clarifications}
+
+Please reply with details so we can complete your order.""",
+        "to be confirmed",
+    ),
+}
+
+
 class ConfirmationGenerator:
     """Generates customer-facing confirmation messages."""
 
-    def __init__(self, api_key: Optional[str] = None):
-        """Initialize with Anthropic client."""
-        self.client = Anthropic(api_key=api_key) if api_key else Anthropic()
+    def __init__(self, api_key: Optional[str] = None, client: Optional[Anthropic] = None):
+        """Initialize with an Anthropic client, or reuse a shared one."""
+        if client is None:
+            client = Anthropic(api_key=api_key) if api_key else Anthropic()
+        self.client = client
 
     def generate(self, order: ExtractedOrder) -> str:
         """
@@ -57,11 +109,12 @@ class ConfirmationGenerator:
             WhatsApp-formatted confirmation message
         """
         # Build context for the LLM
-        items_summary = "\n".join(
+        low = ConfidenceLevel.LOW
+        items_summary = "\n".join([
             f"- {item.product_name}: {item.quantity} {item.unit}"
-            + (f" (needs clarification: {item.notes})" if item.confidence == ConfidenceLevel.LOW else "")
+            f"{f' (needs clarification: {item.notes})' if item.confidence == low else ''}"
             for item in order.items
-        )
+        ])
 
         # Get detected language (default to English)
         language = getattr(order, 'detected_language', DetectedLanguage.ENGLISH)
@@ -113,60 +166,21 @@ Generate a confirmation message. If clarification is needed, ask for it naturall
             for item in order.items
         )
 
-        delivery = order.requested_delivery_date or "to be confirmed"
-
-        # Get detected language
+        # Pick the templates for the detected language (English by default)
         language = getattr(order, 'detected_language', DetectedLanguage.ENGLISH)
+        main_template, clarification_template, delivery_pending = SIMPLE_CONFIRMATION_TEMPLATES.get(
+            language, SIMPLE_CONFIRMATION_TEMPLATES[DetectedLanguage.ENGLISH]
+        )
 
-        # Generate message based on language
-        if language == DetectedLanguage.SWAHILI:
-            delivery_sw = delivery if delivery != "to be confirmed" else "itahibitishwa"
-            message = f"""Habari {order.customer_name}!
-
-Asante sana kwa oda yako kutoka *{customer}*.
-
-*Muhtasari wa Oda:*
-{items_list}
-
-*Uwasilishaji:* {delivery_sw}
-
-Tutahibitisha upatikanaji na kuwasiliana nawe hivi karibuni. Jibu ujumbe huu ikiwa unahitaji kufanya mabadiliko yoyote.
-
-- Timu ya Kijani Supplies"""
-
-            if order.requires_clarification and order.clarification_needed:
-                clarifications = "\n".join(f"  - {c}" for c in order.clarification_needed)
-                message += f"""
-
-*Swali:*
-Tunahitaji maelezo zaidi kuhusu:
-{clarifications}
-
-Tafadhali jibu na maelezo ili tukamilishe oda yako."""
-
-        else:
-            # English (default)
-            message = f"""Hi {order.customer_name}!
-
-Thank you for your order from *{customer}*.
-
-*Order Summary:*
-{items_list}
-
-*Delivery:* {delivery}
-
-We'll confirm availability and get back to you shortly. Reply to this message if you need to make any changes.
-
-- Kijani Supplies Team"""
-
-            if order.requires_clarification and order.clarification_needed:
-                clarifications = "\n".join(f"  - {c}" for c in order.clarification_needed)
-                message += f"""
-
-*Quick question:*
-We need a bit more info on:
-{clarifications}
+        message = main_template.format(
+            customer_name=order.customer_name,
+            customer=customer,
+            items_list=items_list,
+            delivery=order.requested_delivery_date or delivery_pending,
+        )
 
-Please reply with details so we can complete your order."""
+        if order.requires_clarification and order.clarification_needed:
+            clarifications = "\n".join(f"  - {c}" for c in order.clarification_needed)
+            message += clarification_template.format(clarifications=clarifications)
 
         return message
@@ -1,14 +1,45 @@
 """Database connection and session management."""
 
 import os
+import orjson
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import DeclarativeBase
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./demo.db")
 
-engine = create_async_engine(DATABASE_URL, echo=False)
+
+def _json_serializer(value) -> str:
+    """Encode JSON columns with orjson."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+engine = create_async_engine(
+    DATABASE_URL,
+    echo=False,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+)
+
+
+if DATABASE_URL.startswith("sqlite"):
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Use WAL so readers don't block on a committing writer, and fsync less."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        # Durable at checkpoints; safe against corruption in WAL mode
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
+
+
 AsyncSessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-Base = declarative_base()
+
+
+class Base(DeclarativeBase):
+    """Declarative base for the ORM models."""
 
 
 async def init_db():
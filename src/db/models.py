@@ -1,7 +1,7 @@
 """SQLAlchemy ORM models for the demo database."""
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, ForeignKey, Text, JSON
+from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, ForeignKey, Text, JSON, Index
 from sqlalchemy.orm import relationship
 from .database import Base
 
@@ -45,10 +45,13 @@ class Conversation(Base):
     customer_name = Column(String(255), nullable=True)
     status = Column(String(50), default="active")  # active, completed, needs_clarification
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
 
     customer = relationship("Customer", back_populates="conversations")
-    messages = relationship("Message", back_populates="conversation", order_by="Message.created_at")
+    # Endpoints opt in to loading messages (selectinload) so a stray access can't lazy-load
+    messages = relationship(
+        "Message", back_populates="conversation", order_by="Message.created_at", lazy="raise"
+    )
     orders = relationship("Order", back_populates="conversation")
     cumulative_state = relationship("CumulativeOrderState", back_populates="conversation", uselist=False)
 
@@ -70,6 +73,18 @@ class Message(Base):
 class Order(Base):
     """A processed order."""
     __tablename__ = "orders"
+    __table_args__ = (
+        # Latest-order lookup per conversation
+        Index("ix_orders_conversation_created", "conversation_id", "created_at"),
+        # Order listing (newest first, optionally by status). The trailing columns make
+        # the created_at index covering for the metrics summary aggregate, so SQLite
+        # scans the index instead of rows carrying the JSON payloads.
+        Index(
+            "ix_orders_created_at",
+            "created_at", "routing_decision", "confidence_score", "processing_time_ms",
+        ),
+        Index("ix_orders_status_created", "status", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     conversation_id = Column(Integer, ForeignKey("conversations.id"), nullable=True)
@@ -3,13 +3,16 @@
 from .models import ExtractedOrder, ERPOrderPayload, ConfidenceLevel
 
 
+CONFIDENCE_SCORES = {
+    ConfidenceLevel.HIGH: 0.95,
+    ConfidenceLevel.MEDIUM: 0.75,
+    ConfidenceLevel.LOW: 0.50,
+}
+
+
 def confidence_to_score(level: ConfidenceLevel) -> float:
     """Convert confidence level to numeric score."""
-    return {
-        ConfidenceLevel.HIGH: 0.95,
-        ConfidenceLevel.MEDIUM: 0.75,
-        ConfidenceLevel.LOW: 0.50,
-    }[level]
+    return CONFIDENCE_SCORES[level]
 
 
 def build_erp_payload(order: ExtractedOrder) -> ERPOrderPayload:
@@ -45,7 +48,7 @@ def build_erp_payload(order: ExtractedOrder) -> ERPOrderPayload:
         order_lines.append(line)
 
     # Calculate overall confidence score
-    item_scores = [confidence_to_score(item.confidence) for item in order.items]
+    item_scores = [CONFIDENCE_SCORES[item.confidence] for item in order.items]
     avg_confidence = sum(item_scores) / len(item_scores) if item_scores else 0.0
 
     # Adjust for overall order confidence
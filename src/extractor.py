@@ -112,9 +112,11 @@ Return a JSON object with this exact structure:
 class OrderExtractor:
     """Extracts structured order data from WhatsApp messages using Claude."""
 
-    def __init__(self, api_key: Optional[str] = None):
-        """Initialize the extractor with Anthropic client."""
-        self.client = Anthropic(api_key=api_key) if api_key else Anthropic()
+    def __init__(self, api_key: Optional[str] = None, client: Optional[Anthropic] = None):
+        """Initialize the extractor with an Anthropic client, or reuse a shared one."""
+        if client is None:
+            client = Anthropic(api_key=api_key) if api_key else Anthropic()
+        self.client = client
 
     def extract(self, message: str, order_history_context: str = "") -> ExtractedOrder:
         """
@@ -142,9 +144,9 @@ class OrderExtractor:
         # Extract JSON from response (handle potential markdown wrapping)
         json_str = response_text
         if "```json" in response_text:
-            json_str = response_text.split("```json")[1].split("```")[0]
+            json_str = response_text.partition("```json")[2].partition("```")[0]
         elif "```" in response_text:
-            json_str = response_text.split("```")[1].split("```")[0]
+            json_str = response_text.partition("```")[2].partition("```")[0]
 
         data = json.loads(json_str.strip())
 
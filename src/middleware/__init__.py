@@ -0,0 +1,5 @@
+"""ASGI middleware package."""
+
+from .asgi import ProcessTimeMiddleware
+
+__all__ = ["ProcessTimeMiddleware"]
@@ -0,0 +1,34 @@
+"""
+Pure ASGI middleware.
+
+New middleware should follow this pattern rather than subclassing Starlette's
+BaseHTTPMiddleware, which runs every request through an extra task group and
+response buffering layer. A pure ASGI middleware only wraps ``send`` and works
+directly on the raw header list.
+"""
+
+import time
+
+
+class ProcessTimeMiddleware:
+    """Adds an ``X-Process-Time`` header (milliseconds) to HTTP responses."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                headers = list(message.get("headers", []))
+                headers.append((b"x-process-time", f"{elapsed_ms:.1f}".encode("latin-1")))
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
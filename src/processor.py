@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 from typing import Optional, TYPE_CHECKING
+from anthropic import Anthropic
 from .models import ProcessingResult, OdooSubmissionResult
 from .extractor import OrderExtractor
 from .confirmation import ConfirmationGenerator
@@ -27,8 +28,10 @@ class OrderProcessor:
             api_key: Anthropic API key (uses ANTHROPIC_API_KEY env var if not provided)
             odoo_client: Optional Odoo client for ERP submission
         """
-        self.extractor = OrderExtractor(api_key)
-        self.confirmation_generator = ConfirmationGenerator(api_key)
+        # One client, and so one HTTP connection pool, for extraction and confirmation
+        client = Anthropic(api_key=api_key) if api_key else Anthropic()
+        self.extractor = OrderExtractor(client=client)
+        self.confirmation_generator = ConfirmationGenerator(client=client)
         self.odoo_client = odoo_client
 
     def process(
@@ -7,6 +7,7 @@ from .history import (
     find_customer_fuzzy,
     resolve_usual_order,
     detect_usual_reference,
+    extract_organization_hint,
 )
 from .excel_parser import (
     parse_excel_order,
@@ -37,6 +38,7 @@ __all__ = [
     "find_customer_fuzzy",
     "resolve_usual_order",
     "detect_usual_reference",
+    "extract_organization_hint",
     # Excel
     "parse_excel_order",
     "excel_order_to_text",
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 from io import BytesIO
-from typing import Optional
+from typing import BinaryIO, Optional, Union
 from openpyxl import load_workbook
 from openpyxl.worksheet.worksheet import Worksheet
 from pydantic import BaseModel, Field
@@ -24,6 +24,7 @@ class ExcelOrderSheet(BaseModel):
     category: str
     items: list[ExcelOrderItem] = Field(default_factory=list)
     total_items: int = 0
+    items_with_price: int = 0
     total_value: Optional[float] = None
 
 
@@ -35,6 +36,7 @@ class ExcelOrderResult(BaseModel):
     sheets: list[ExcelOrderSheet] = Field(default_factory=list)
     total_items: int = 0
     total_categories: int = 0
+    items_with_price: int = 0
     total_value: Optional[float] = None
     warnings: list[str] = Field(default_factory=list)
     error: Optional[str] = None
@@ -93,6 +95,7 @@ def parse_worksheet(sheet: Worksheet, category: str) -> ExcelOrderSheet:
 
     # Parse data rows (skip header)
     total_value = 0.0
+    items_with_price = 0
     for row_num, row in enumerate(sheet.iter_rows(min_row=2, values_only=True), start=2):
         # Skip empty rows
         if not row or all(cell is None or cell == "" for cell in row):
@@ -137,6 +140,7 @@ def parse_worksheet(sheet: Worksheet, category: str) -> ExcelOrderSheet:
                 try:
                     price = float(price_value)
                     total_value += price * quantity
+                    items_with_price += 1
                 except (ValueError, TypeError):
                     pass
 
@@ -154,12 +158,13 @@ def parse_worksheet(sheet: Worksheet, category: str) -> ExcelOrderSheet:
         category=category,
         items=items,
         total_items=len(items),
+        items_with_price=items_with_price,
         total_value=total_value if total_value > 0 else None,
     )
 
 
 def parse_excel_order(
-    file_content: bytes,
+    file_content: Union[bytes, BinaryIO],
     filename: Optional[str] = None,
     customer_name: Optional[str] = None,
 ) -> ExcelOrderResult:
@@ -167,7 +172,8 @@ def parse_excel_order(
     Parse a multi-worksheet Excel order file.
 
     Args:
-        file_content: Raw bytes of the Excel file
+        file_content: Raw bytes of the Excel file, or a seekable binary file
+            object (e.g. an upload's spooled temporary file) read in place
         filename: Original filename (optional)
         customer_name: Customer name if known (optional)
 
@@ -175,8 +181,9 @@ def parse_excel_order(
         ExcelOrderResult with parsed order data
     """
     try:
-        # Load workbook from bytes
-        workbook = load_workbook(filename=BytesIO(file_content), read_only=True, data_only=True)
+        # Load workbook from bytes or straight from the file object
+        source = BytesIO(file_content) if isinstance(file_content, (bytes, bytearray)) else file_content
+        workbook = load_workbook(filename=source, read_only=True, data_only=True)
     except Exception as e:
         return ExcelOrderResult(
             success=False,
@@ -186,6 +193,7 @@ def parse_excel_order(
 
     sheets = []
     total_items = 0
+    items_with_price = 0
     total_value = 0.0
     warnings = []
 
@@ -205,6 +213,7 @@ def parse_excel_order(
         if parsed_sheet.items:
             sheets.append(parsed_sheet)
             total_items += parsed_sheet.total_items
+            items_with_price += parsed_sheet.items_with_price
             if parsed_sheet.total_value:
                 total_value += parsed_sheet.total_value
 
@@ -224,6 +233,7 @@ def parse_excel_order(
         sheets=sheets,
         total_items=total_items,
         total_categories=len(sheets),
+        items_with_price=items_with_price,
         total_value=total_value if total_value > 0 else None,
         warnings=warnings,
     )
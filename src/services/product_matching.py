@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass
 from difflib import SequenceMatcher
+from functools import lru_cache
 from typing import Optional, List, Tuple, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
@@ -96,6 +97,42 @@ for swahili, english in SWAHILI_TO_ENGLISH.items():
     ALIAS_TO_CANONICAL[swahili.lower()] = english.lower()
 
 
+# Unit words stripped from product names, as (" unit", "unit ") replacement pairs
+UNITS_TO_REMOVE = [
+    'kg', 'kgs', 'g', 'grams', 'l', 'ltr', 'litre', 'liters', 'litres',
+    'ml', 'pieces', 'pcs', 'pc', 'trays', 'tray', 'crates', 'crate',
+    'bags', 'bag', 'bottles', 'bottle', 'packets', 'packet', 'pkt',
+    'cartons', 'carton', 'boxes', 'box', 'rolls', 'roll', 'dozen', 'doz'
+]
+_UNIT_REPLACEMENTS = tuple((f' {unit}', f'{unit} ') for unit in UNITS_TO_REMOVE)
+
+
+@lru_cache(maxsize=4096)
+def normalize_product_name(name: str) -> str:
+    """Normalize product name for matching.
+
+    Pure function of the name, so results are memoized; the same catalogue
+    names recur across orders and within large Excel uploads.
+    """
+    if not name:
+        return ""
+
+    # Lowercase and strip
+    normalized = name.lower().strip()
+
+    # Remove common units that might be in name
+    for with_leading_space, with_trailing_space in _UNIT_REPLACEMENTS:
+        normalized = normalized.replace(with_leading_space, '')
+        normalized = normalized.replace(with_trailing_space, '')
+
+    # Remove numbers at the end
+    words = normalized.split()
+    words = [w for w in words if not w.isdigit()]
+    normalized = ' '.join(words)
+
+    return normalized.strip()
+
+
 def levenshtein_distance(s1: str, s2: str) -> int:
     """Calculate Levenshtein (edit) distance between two strings."""
     if len(s1) < len(s2):
@@ -135,29 +172,7 @@ class ProductMatchingService:
 
     def normalize(self, name: str) -> str:
         """Normalize product name for matching."""
-        if not name:
-            return ""
-
-        # Lowercase and strip
-        normalized = name.lower().strip()
-
-        # Remove common units that might be in name
-        units_to_remove = [
-            'kg', 'kgs', 'g', 'grams', 'l', 'ltr', 'litre', 'liters', 'litres',
-            'ml', 'pieces', 'pcs', 'pc', 'trays', 'tray', 'crates', 'crate',
-            'bags', 'bag', 'bottles', 'bottle', 'packets', 'packet', 'pkt',
-            'cartons', 'carton', 'boxes', 'box', 'rolls', 'roll', 'dozen', 'doz'
-        ]
-        for unit in units_to_remove:
-            normalized = normalized.replace(f' {unit}', '')
-            normalized = normalized.replace(f'{unit} ', '')
-
-        # Remove numbers at the end
-        words = normalized.split()
-        words = [w for w in words if not w.isdigit()]
-        normalized = ' '.join(words)
-
-        return normalized.strip()
+        return normalize_product_name(name)
 
     def find_alias(self, name: str) -> Optional[str]:
         """Look up canonical name from alias dictionary."""
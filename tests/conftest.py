@@ -0,0 +1,111 @@
+"""Shared fixtures for API tests."""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.api import routes
+from src.db import get_db
+from src.db.database import Base
+from src.erp_payload import build_erp_payload
+from src.models import ExtractedItem, ExtractedOrder, ProcessingResult
+
+
+class FakeProcessor:
+    """Stand-in for OrderProcessor that returns a fixed extraction without calling the LLM."""
+
+    def __init__(self):
+        self.calls = []
+
+    def process(self, message, use_simple_confirmation=False, submit_to_odoo=False, order_history_context=""):
+        self.calls.append((message, order_history_context))
+        order = ExtractedOrder(
+            customer_name="Sarah",
+            customer_organization="Saruni Mara",
+            items=[
+                ExtractedItem(product_name="Rice", quantity=50, unit="kg", confidence="high", original_text="50kg rice"),
+                ExtractedItem(product_name="Charcoal", quantity=10, unit="bags", confidence="high", original_text="10 bags charcoal"),
+            ],
+            requested_delivery_date="Friday",
+            overall_confidence="high",
+            requires_clarification=False,
+            raw_message=message,
+        )
+        return ProcessingResult(
+            success=True,
+            extracted_order=order,
+            erp_payload=build_erp_payload(order),
+            confirmation_message="Order received",
+        )
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    """Session factory bound to a fresh SQLite database with all tables created."""
+    # NullPool: the test client runs the app on its own event loop, so
+    # connections must not be shared with the loop used for seeding
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}", poolclass=NullPool)
+
+    async def create_tables():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    asyncio.run(create_tables())
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    asyncio.run(engine.dispose())
+
+
+@pytest.fixture
+def seed(session_factory):
+    """Add ORM objects to the test database and return them with their ids loaded."""
+    def add(*objects):
+        async def run():
+            async with session_factory() as session:
+                session.add_all(objects)
+                await session.commit()
+        asyncio.run(run())
+        return objects
+
+    return add
+
+
+@pytest.fixture
+def count_rows(session_factory):
+    """Count rows of a model in the test database, optionally filtered."""
+    def count(model, *criteria):
+        async def run():
+            async with session_factory() as session:
+                query = select(func.count()).select_from(model).where(*criteria)
+                return (await session.execute(query)).scalar_one()
+        return asyncio.run(run())
+
+    return count
+
+
+@pytest.fixture
+def fake_processor(monkeypatch):
+    """Replace the shared OrderProcessor with a FakeProcessor."""
+    processor = FakeProcessor()
+    monkeypatch.setattr(routes, "get_order_processor", lambda: processor)
+    return processor
+
+
+@pytest.fixture
+def client(session_factory, fake_processor):
+    """Test client for the API router backed by the test database."""
+    async def override_get_db():
+        async with session_factory() as session:
+            yield session
+
+    app = FastAPI()
+    app.include_router(routes.router, prefix="/api")
+    app.dependency_overrides[get_db] = override_get_db
+    routes.invalidate_order_caches()
+    with TestClient(app) as test_client:
+        yield test_client
+    routes.invalidate_order_caches()
@@ -0,0 +1,348 @@
+"""Tests for the API routes."""
+
+import asyncio
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from src.api import routes
+from src.db import Conversation, CumulativeOrderItem, Order, OrderItem
+from src.services.excel_parser import parse_excel_order
+
+SAMPLE_ORDER_XLSX = Path(__file__).resolve().parent.parent / "sample_order.xlsx"
+
+
+def upload_excel(client, path=SAMPLE_ORDER_XLSX, filename="sample_order.xlsx", **data):
+    """Post an Excel file to the upload endpoint."""
+    with open(path, "rb") as f:
+        return client.post("/api/excel-order", files={"file": (filename, f)}, data=data)
+
+
+class TestMetricsSummary:
+    """Test the dashboard metrics aggregate."""
+
+    def test_counts_orders_across_day_and_week_boundaries(self, client, seed):
+        now = datetime.utcnow()
+        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        week_start = today_start - timedelta(days=now.weekday())
+        created = [
+            today_start,
+            today_start - timedelta(seconds=1),
+            week_start,
+            week_start - timedelta(seconds=1),
+            week_start - timedelta(days=30),
+        ]
+        seed(*[
+            Order(
+                customer_name="Sarah",
+                confidence_score=0.9,
+                status="auto_processed",
+                routing_decision="auto_process",
+                processing_time_ms=1000,
+                created_at=created_at,
+            )
+            for created_at in created
+        ])
+
+        response = client.get("/api/metrics/summary")
+
+        assert response.status_code == 200
+        summary = response.json()
+        assert summary["total_orders"] == 5
+        assert summary["orders_today"] == sum(1 for c in created if c >= today_start)
+        assert summary["orders_this_week"] == sum(1 for c in created if c >= week_start)
+        assert summary["auto_processed_count"] == 5
+        assert summary["average_confidence"] == 0.9
+
+    def test_empty_database(self, client):
+        summary = client.get("/api/metrics/summary").json()
+        assert summary["total_orders"] == 0
+        assert summary["orders_today"] == 0
+        assert summary["orders_this_week"] == 0
+        assert summary["auto_process_rate"] == 0
+
+
+class TestListOrders:
+    """Test the order listing used by the dashboard."""
+
+    def test_newest_first_with_status_filter(self, client, seed):
+        start = datetime(2024, 5, 1, 12, 0, 0)
+        seed(*[
+            Order(customer_name=f"c{i}", status=status, created_at=start + timedelta(minutes=i))
+            for i, status in enumerate(["auto_process", "review", "review", "manual", "review"])
+        ])
+
+        all_orders = client.get("/api/orders").json()
+        review = client.get("/api/orders", params={"status": "review"}).json()
+        review_page = client.get("/api/orders", params={"status": "review", "limit": 1, "offset": 1}).json()
+
+        assert [o["customer_name"] for o in all_orders] == ["c4", "c3", "c2", "c1", "c0"]
+        assert [o["customer_name"] for o in review] == ["c4", "c2", "c1"]
+        assert [o["customer_name"] for o in review_page] == ["c2"]
+
+    def test_limit_is_bounded(self, client):
+        assert client.get("/api/orders", params={"limit": routes.MAX_PAGE_SIZE + 1}).status_code == 422
+        assert client.get("/api/orders", params={"limit": 0}).status_code == 422
+
+
+def fetch_all_pages(client, url, timestamp_field, limit=2):
+    """Follow the keyset cursor from page to page and return every row."""
+    rows = []
+    params = {"limit": limit}
+    while True:
+        page = client.get(url, params=params).json()
+        rows.extend(page)
+        if len(page) < limit:
+            return rows
+        params = {"limit": limit, "before": page[-1][timestamp_field], "before_id": page[-1]["id"]}
+
+
+class TestKeysetPagination:
+    """Test the before/before_id cursor on list endpoints."""
+
+    def test_orders_pages_through_equal_timestamps(self, client, seed):
+        shared = datetime(2024, 5, 1, 12, 0, 0)
+        seed(*[Order(customer_name=f"c{i}", created_at=shared) for i in range(5)])
+        seed(Order(customer_name="newer", created_at=shared + timedelta(hours=1)))
+        seed(Order(customer_name="older", created_at=shared - timedelta(hours=1)))
+
+        rows = fetch_all_pages(client, "/api/orders", "created_at")
+
+        assert [row["id"] for row in rows] == [6, 5, 4, 3, 2, 1, 7]
+
+    def test_orders_cursor_with_status_filter(self, client, seed):
+        shared = datetime(2024, 5, 1, 12, 0, 0)
+        seed(*[
+            Order(customer_name=f"c{i}", status="review" if i % 2 else "auto_process", created_at=shared)
+            for i in range(6)
+        ])
+
+        first = client.get("/api/orders", params={"status": "review", "limit": 2}).json()
+        rest = client.get("/api/orders", params={
+            "status": "review", "limit": 2, "before": first[-1]["created_at"], "before_id": first[-1]["id"],
+        }).json()
+
+        assert [row["id"] for row in first + rest] == [6, 4, 2]
+
+    def test_orders_before_without_id(self, client, seed):
+        shared = datetime(2024, 5, 1, 12, 0, 0)
+        seed(Order(created_at=shared), Order(created_at=shared), Order(created_at=shared - timedelta(minutes=1)))
+
+        rows = client.get("/api/orders", params={"before": shared.isoformat()}).json()
+
+        assert [row["id"] for row in rows] == [3]
+
+    def test_conversations_pages_through_equal_timestamps(self, client, seed):
+        shared = datetime(2024, 5, 1, 12, 0, 0)
+        seed(*[Conversation(customer_name=f"c{i}", created_at=shared, updated_at=shared) for i in range(5)])
+
+        rows = fetch_all_pages(client, "/api/conversations", "updated_at")
+
+        assert [row["id"] for row in rows] == [5, 4, 3, 2, 1]
+        assert all(row["message_count"] == 0 for row in rows)
+
+
+class TestProcessMessage:
+    """Test message processing through the API."""
+
+    def test_creates_order_from_message(self, client, fake_processor):
+        response = client.post("/api/messages", json={"content": "Hi, Sarah from Saruni Mara. 50kg rice"})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["order"]["customer_name"] == "Sarah"
+        assert [item["product_name"] for item in body["cumulative_state"]["items"]] == ["Rice", "Charcoal"]
+        assert len(fake_processor.calls) == 1
+
+    def test_passes_order_history_to_processor(self, client, fake_processor):
+        message = "Hi, Sarah from Saruni Mara. 50kg rice"
+        client.post("/api/messages", json={"content": message})
+        client.post("/api/messages", json={"content": message + " again"})
+
+        first_context = fake_processor.calls[0][1]
+        second_context = fake_processor.calls[1][1]
+        assert first_context == ""
+        assert "Rice" in second_context
+
+    def test_writes_order_items(self, client, count_rows):
+        body = client.post("/api/messages", json={"content": "Hi, Sarah from Saruni Mara. 50kg rice"}).json()
+
+        assert count_rows(OrderItem, OrderItem.order_id == body["order"]["id"]) == 2
+        assert count_rows(OrderItem) == 2
+
+
+class TestExcelOrderItems:
+    """Test the rows written for an uploaded Excel order."""
+
+    def test_writes_order_items_and_cumulative_items(self, client, count_rows):
+        body = upload_excel(client).json()
+
+        assert body["success"] is True
+        assert body["total_items"] == 18
+        assert count_rows(OrderItem, OrderItem.order_id == body["order_id"]) == 18
+        assert count_rows(CumulativeOrderItem) == 18
+
+    def test_state_and_snapshot_items(self, client):
+        body = upload_excel(client, customer_name="Kilima Lodge").json()
+
+        state = client.get(f"/api/conversations/{body['conversation_id']}/state").json()
+
+        assert state["customer_name"] == "Kilima Lodge"
+        items = state["cumulative_state"]["items"]
+        assert len(items) == 18
+        assert all(item["normalized_name"] for item in items)
+        snapshot = state["snapshots"][0]
+        assert snapshot["version"] == 1
+        assert [item["product_name"] for item in snapshot["items"]] == [item["product_name"] for item in items]
+        assert len(snapshot["changes"]["added"]) == 18
+
+    def test_writes_conversation_in_one_transaction(self, client, count_rows):
+        assert client.get("/api/metrics/summary").json()["total_orders"] == 0
+
+        body = upload_excel(client).json()
+
+        assert count_rows(Order, Order.conversation_id == body["conversation_id"]) == 1
+        conversations = client.get("/api/conversations").json()
+        assert [(c["id"], c["message_count"]) for c in conversations] == [(body["conversation_id"], 3)]
+        roles = [m["role"] for m in client.get(f"/api/conversations/{body['conversation_id']}/state").json()["messages"]]
+        assert roles == ["customer", "system", "assistant"]
+        # The write drops the cached metrics
+        assert client.get("/api/metrics/summary").json()["total_orders"] == 1
+
+    def test_item_representations(self, client):
+        body = upload_excel(client).json()
+
+        order = client.get("/api/orders").json()[0]
+        assert order["id"] == body["order_id"]
+        assert order["items_json"]["items"][0] == {
+            "category": "Dairy",
+            "subcategory": "Milk",
+            "product_name": "Fresh Milk",
+            "quantity": 50.0,
+            "unit": "L",
+            "price": 120.0,
+        }
+
+        state = client.get(f"/api/conversations/{body['conversation_id']}/state").json()
+        first_item = state["cumulative_state"]["items"][0]
+        assert first_item["notes"] == "Category: Dairy, Subcategory: Milk, Price: KES 120"
+        assert first_item["first_mentioned_message_id"] == state["messages"][0]["id"]
+
+        summary = state["messages"][1]
+        assert summary["role"] == "system"
+        assert "*Dairy*" in summary["content"]
+        assert "  • Fresh Milk: 50.0 L @ KES 120" in summary["content"]
+        assert "*Total Items:* 18" in summary["content"]
+
+
+class GatedProcessor:
+    """Processor that blocks until released, so concurrent callers overlap."""
+
+    def __init__(self, wrapped, error=None):
+        self.wrapped = wrapped
+        self.error = error
+        self.release = threading.Event()
+        self.calls = 0
+
+    def process(self, message, order_history_context=""):
+        self.calls += 1
+        self.release.wait(timeout=5)
+        if self.error:
+            raise self.error
+        return self.wrapped.process(message, order_history_context=order_history_context)
+
+
+class TestExtractOrderSingleFlight:
+    """Test that identical concurrent extractions share one processor call."""
+
+    def run_concurrently(self, processor, message="50kg rice"):
+        async def run():
+            first = asyncio.ensure_future(routes.extract_order(message))
+            second = asyncio.ensure_future(routes.extract_order(message))
+            # Let both callers reach the shared future before releasing the worker
+            await asyncio.sleep(0.05)
+            processor.release.set()
+            return await asyncio.gather(first, second, return_exceptions=True)
+
+        return asyncio.run(run())
+
+    def test_callers_share_one_call_but_not_the_result(self, monkeypatch, fake_processor):
+        processor = GatedProcessor(fake_processor)
+        monkeypatch.setattr(routes, "get_order_processor", lambda: processor)
+
+        first, second = self.run_concurrently(processor)
+
+        assert processor.calls == 1
+        assert first == second
+        assert first is not second
+        assert first.extracted_order.items is not second.extracted_order.items
+        second.extracted_order.items[0].quantity = 99
+        assert first.extracted_order.items[0].quantity == 50
+        assert routes._inflight_extractions == {}
+
+    def test_failure_reaches_every_caller(self, monkeypatch, fake_processor):
+        processor = GatedProcessor(fake_processor, error=RuntimeError("LLM unavailable"))
+        monkeypatch.setattr(routes, "get_order_processor", lambda: processor)
+
+        results = self.run_concurrently(processor)
+
+        assert processor.calls == 1
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert routes._inflight_extractions == {}
+
+        # A later request starts a fresh extraction instead of reusing the failure
+        processor.error = None
+        result = asyncio.run(routes.extract_order("50kg rice"))
+        assert processor.calls == 2
+        assert result.success
+
+
+class TestExcelUpload:
+    """Test validation and parsing of Excel uploads."""
+
+    def test_rejects_oversized_file(self, client, monkeypatch, count_rows):
+        monkeypatch.setattr(routes, "MAX_EXCEL_UPLOAD_BYTES", 1024)
+
+        response = upload_excel(client)
+
+        assert response.status_code == 413
+        assert count_rows(Conversation) == 0
+
+    def test_accepts_file_at_limit(self, client, monkeypatch):
+        monkeypatch.setattr(routes, "MAX_EXCEL_UPLOAD_BYTES", SAMPLE_ORDER_XLSX.stat().st_size)
+
+        assert upload_excel(client).status_code == 200
+
+    def test_rejects_non_excel_filename(self, client):
+        response = upload_excel(client, filename="order.csv")
+
+        assert response.status_code == 400
+
+    def test_unreadable_workbook(self, client, tmp_path, count_rows):
+        broken = tmp_path / "broken.xlsx"
+        broken.write_bytes(b"not a workbook")
+
+        body = upload_excel(client, path=broken, filename="broken.xlsx").json()
+
+        assert body["success"] is False
+        assert body["error"].startswith("Failed to read Excel file")
+        assert count_rows(Conversation) == 0
+
+    def test_parses_off_the_event_loop(self, client, monkeypatch):
+        parse_threads = []
+
+        def recording_parse(*args):
+            parse_threads.append(threading.get_ident())
+            # A worker thread has no running event loop
+            with pytest.raises(RuntimeError):
+                asyncio.get_running_loop()
+            return parse_excel_order(*args)
+
+        monkeypatch.setattr(routes, "parse_excel_order", recording_parse)
+
+        body = upload_excel(client).json()
+
+        assert body["success"] is True
+        assert len(parse_threads) == 1
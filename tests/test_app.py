@@ -0,0 +1,164 @@
+"""Tests for static frontend serving."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app import (
+    choose_encoding,
+    load_assets,
+    load_index_html,
+    mount_frontend,
+    scan_frontend_files,
+)
+
+INDEX_HTML = b"<!doctype html><html><body><div id='root'></div></body></html>"
+APP_JS = b"console.log('order intake');\n" * 50
+
+
+class TestChooseEncoding:
+    """Test Accept-Encoding negotiation against pre-compressed variants."""
+
+    available = {"identity": b"", "gzip": b"", "br": b""}
+
+    def test_prefers_brotli(self):
+        assert choose_encoding("gzip, deflate, br", self.available) == "br"
+
+    def test_falls_back_to_gzip_without_brotli(self):
+        assert choose_encoding("gzip, br", {"identity": b"", "gzip": b""}) == "gzip"
+
+    def test_no_header_is_identity(self):
+        assert choose_encoding("", self.available) == "identity"
+
+    def test_honours_q_value_ranking(self):
+        assert choose_encoding("br;q=0.5, gzip;q=0.8", self.available) == "gzip"
+
+    def test_wildcard_accepts_unlisted_codings(self):
+        assert choose_encoding("*", self.available) == "br"
+
+    def test_explicit_refusal_beats_wildcard(self):
+        assert choose_encoding("br;q=0, *", self.available) == "gzip"
+        assert choose_encoding("br;q=0.00, gzip;q=0.000, *", self.available) == "identity"
+
+    def test_q_after_other_parameters(self):
+        assert choose_encoding("br;level=5;q=0, gzip", self.available) == "gzip"
+
+    def test_whitespace_and_case(self):
+        assert choose_encoding(" GZIP ; Q = 0 , br ; q=0", self.available) == "identity"
+
+    def test_identity_refused(self):
+        assert choose_encoding("identity;q=0, gzip", self.available) == "gzip"
+        assert choose_encoding("identity;q=0", self.available) is None
+        assert choose_encoding("*;q=0", self.available) is None
+
+    def test_wildcard_refusal_keeps_listed_codings(self):
+        assert choose_encoding("gzip, *;q=0", self.available) == "gzip"
+
+    def test_uncompressed_asset(self):
+        assert choose_encoding("gzip, br", {"identity": b""}) == "identity"
+
+
+@pytest.fixture
+def frontend_client(tmp_path):
+    """Test client for the frontend routes backed by a temporary build directory."""
+    dist = tmp_path / "dist"
+    (dist / "assets").mkdir(parents=True)
+    (dist / "index.html").write_bytes(INDEX_HTML)
+    (dist / "vite.svg").write_text("<svg xmlns='http://www.w3.org/2000/svg'/>")
+    (dist / "assets" / "index-abc.js").write_bytes(APP_JS)
+    (dist / "assets" / "logo-abc.png").write_bytes(b"\x89PNG\r\n")
+
+    app = FastAPI()
+    mount_frontend(app, dist)
+    app.state.static_files = scan_frontend_files(dist)
+    app.state.index_html_bytes, app.state.index_etag = load_index_html(dist / "index.html")
+    app.state.assets = load_assets(dist / "assets")
+    return TestClient(app)
+
+
+class TestStaticAssets:
+    """Test in-memory asset serving."""
+
+    def test_serves_gzip_variant(self, frontend_client):
+        response = frontend_client.get("/assets/index-abc.js", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert "immutable" in response.headers["cache-control"]
+        assert int(response.headers["content-length"]) < len(APP_JS)
+        assert response.content == APP_JS
+
+    def test_serves_identity_when_gzip_refused(self, frontend_client):
+        response = frontend_client.get("/assets/index-abc.js", headers={"Accept-Encoding": "gzip;q=0, *"})
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        assert response.content == APP_JS
+
+    def test_binary_asset_is_not_compressed(self, frontend_client):
+        response = frontend_client.get("/assets/logo-abc.png", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        assert response.headers["content-type"] == "image/png"
+
+    def test_no_acceptable_encoding(self, frontend_client):
+        response = frontend_client.get("/assets/logo-abc.png", headers={"Accept-Encoding": "identity;q=0"})
+        assert response.status_code == 406
+
+    def test_missing_asset_is_404(self, frontend_client):
+        response = frontend_client.get("/assets/missing.js")
+
+        assert response.status_code == 404
+        assert response.json() == {"detail": "Asset not found"}
+
+
+class TestIndexAndSpaFallback:
+    """Test index.html caching and client-side route fallback."""
+
+    def test_index_has_etag(self, frontend_client):
+        response = frontend_client.get("/")
+
+        assert response.status_code == 200
+        assert response.content == INDEX_HTML
+        assert response.headers["etag"].startswith('"')
+        assert response.headers["cache-control"] == "no-cache"
+
+    def test_matching_etag_is_304(self, frontend_client):
+        etag = frontend_client.get("/").headers["etag"]
+
+        response = frontend_client.get("/", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_stale_etag_gets_body(self, frontend_client):
+        response = frontend_client.get("/", headers={"If-None-Match": '"stale"'})
+
+        assert response.status_code == 200
+        assert response.content == INDEX_HTML
+
+    def test_client_route_falls_back_to_index(self, frontend_client):
+        etag = frontend_client.get("/").headers["etag"]
+
+        response = frontend_client.get("/orders/42")
+        assert response.status_code == 200
+        assert response.content == INDEX_HTML
+
+        response = frontend_client.get("/orders/42", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+    def test_serves_files_from_dist(self, frontend_client):
+        response = frontend_client.get("/vite.svg")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("image/svg+xml")
+
+    def test_api_and_ws_paths_keep_404(self, frontend_client):
+        assert frontend_client.get("/api/unknown").status_code == 404
+        assert frontend_client.get("/ws/unknown").status_code == 404
+
+    def test_non_get_requests_keep_404(self, frontend_client):
+        assert frontend_client.post("/orders/42").status_code == 404
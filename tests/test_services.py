@@ -0,0 +1,74 @@
+"""Tests for service-layer helpers."""
+
+from src.services.history import detect_usual_reference, extract_organization_hint
+from src.services.product_matching import ProductMatchingService, normalize_product_name
+
+
+class TestOrganizationHint:
+    """Test organization extraction from raw messages."""
+
+    def test_from_pattern(self):
+        message = "Hi, this is Sarah from Saruni Mara. We need rice"
+        assert extract_organization_hint(message) == "saruni mara"
+
+    def test_dash_signature(self):
+        message = "Need 5 boxes of the usual soap - Kilima Safari Lodge"
+        assert extract_organization_hint(message) == "kilima safari lodge"
+
+    def test_here_at_pattern(self):
+        message = "We are here at Tribe Hotel, Nairobi"
+        assert extract_organization_hint(message) == "tribe hotel"
+
+    def test_matches_at_inside_words(self):
+        """Keywords are plain substrings, so 'what ' also reads as 'at ...'."""
+        assert extract_organization_hint("what we need is rice") == "we need is rice"
+        assert extract_organization_hint("Please check that order") == "order"
+
+    def test_matches_from_inside_words(self):
+        message = "Ordering gear refrom Serena Hotel"
+        assert extract_organization_hint(message) == "serena hotel"
+
+    def test_no_keyword(self):
+        assert extract_organization_hint("Need 50kg rice") is None
+
+    def test_all_candidates_implausible(self):
+        assert extract_organization_hint("rice from abc. at x") is None
+
+    def test_skips_implausible_lengths(self):
+        message = "- ok. Thanks from Angama Mara"
+        assert extract_organization_hint(message) == "angama mara"
+
+    def test_keyword_priority(self):
+        """'from' wins over an earlier 'at', as in the original keyword order."""
+        assert extract_organization_hint("Order at 5pm from Acme Hotel") == "acme hotel"
+
+    def test_uses_last_occurrence(self):
+        message = "Order from the team from Tribe Hotel"
+        assert extract_organization_hint(message) == "tribe hotel"
+
+
+class TestUsualReference:
+    """Test detection of 'the usual' style reorders."""
+
+    def test_case_insensitive(self):
+        assert detect_usual_reference("Send THE USUAL please")
+
+    def test_swahili_phrase(self):
+        assert detect_usual_reference("Tuma kama kawaida, asante")
+
+    def test_plain_order(self):
+        assert not detect_usual_reference("We need 50kg rice and 20kg sugar")
+
+
+class TestNormalizeProductName:
+    """Test product name normalization."""
+
+    def test_strips_units_and_counts(self):
+        assert normalize_product_name("Fresh Milk 2 L") == "fresh milk"
+        assert normalize_product_name("Eggs tray 30") == "eggs"
+
+    def test_empty(self):
+        assert normalize_product_name("") == ""
+
+    def test_service_delegates(self):
+        assert ProductMatchingService().normalize("  Sugar  ") == "sugar"